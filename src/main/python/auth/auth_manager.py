@@ -36,7 +36,8 @@ class AuthManager:
         self.logger = self._setup_logger()
         self.cookie_storage = CookieStorage(
             file_path=self.config.cookie_file_path,
-            encryption_key=self.config.cookie_encryption_key
+            encryption_key=self.config.cookie_encryption_key,
+            max_age_hours=self.config.session_timeout_hours
         )
         
         # Authentication state
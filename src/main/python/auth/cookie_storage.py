@@ -17,15 +17,28 @@ class CookieStorage:
     Secure cookie storage with encryption and expiration management
     """
     
-    def __init__(self, file_path: str, encryption_key: Optional[str] = None):
+    # Cookie lifetime used when none is configured (THREADS_SESSION_TIMEOUT)
+    DEFAULT_MAX_AGE_HOURS = 24
+    
+    def __init__(
+        self,
+        file_path: str,
+        encryption_key: Optional[str] = None,
+        max_age_hours: int = DEFAULT_MAX_AGE_HOURS
+    ):
         """
         Initialize cookie storage
         
         Args:
             file_path: Path to cookie storage file
             encryption_key: Optional encryption key for cookie security
+            max_age_hours: How long saved cookies stay valid
         """
         self.file_path = Path(file_path).expanduser()
+        self.max_age_hours = max_age_hours
+        # Small sidecar holding only the metadata, so get_cookie_info does
+        # not have to decrypt and parse the whole cookie list
+        self.meta_path = self.file_path.with_name(self.file_path.name + '.meta')
         self.logger = self._setup_logger()
         
         # Setup encryption
@@ -86,12 +99,15 @@ class CookieStorage:
                 'cookies': cookies
             }
             
-            # Encrypt and save
-            json_data = json.dumps(cookie_data)
-            encrypted_data = self.cipher.encrypt(json_data.encode())
-            
-            with open(self.file_path, 'wb') as f:
-                f.write(encrypted_data)
+            # Encrypt and save; the metadata is written after the cookies so a
+            # sidecar is never newer than the file it describes
+            self._write_encrypted(self.file_path, cookie_data)
+            self._write_encrypted(self.meta_path, {
+                'domain': domain,
+                'saved_at': cookie_data['saved_at'],
+                'user_agent': user_agent,
+                'cookie_count': len(cookies)
+            })
             
             self.logger.info(f"Saved {len(cookies)} cookies for domain {domain}")
             return True
@@ -100,6 +116,57 @@ class CookieStorage:
             self.logger.error(f"Failed to save cookies: {e}")
             return False
     
+    def _write_encrypted(self, path: Path, data: Dict[str, Any]):
+        """
+        Encrypt data as JSON and atomically replace the file at path
+        
+        Args:
+            path: Destination file
+            data: JSON-serializable data to store
+        """
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(self.cipher.encrypt(json.dumps(data).encode()))
+        os.replace(tmp_path, path)
+    
+    def _read_encrypted(self, path: Path) -> Dict[str, Any]:
+        """
+        Read and decrypt a JSON file written by _write_encrypted
+        
+        Args:
+            path: File to read
+            
+        Returns:
+            Decoded data
+        """
+        with open(path, 'rb') as f:
+            encrypted_data = f.read()
+        return json.loads(self.cipher.decrypt(encrypted_data).decode())
+    
+    def _read_metadata(self) -> Dict[str, Any]:
+        """
+        Read the cookie metadata, preferring the sidecar file
+        
+        Falls back to the full cookie file when the sidecar is missing or
+        older than it (cookies saved by a version without the sidecar).
+        
+        Returns:
+            Dict with 'domain', 'saved_at', 'user_agent' and 'cookie_count'
+        """
+        try:
+            if self.meta_path.stat().st_mtime >= self.file_path.stat().st_mtime:
+                return self._read_encrypted(self.meta_path)
+        except FileNotFoundError:
+            pass
+        
+        cookie_data = self._read_encrypted(self.file_path)
+        return {
+            'domain': cookie_data.get('domain'),
+            'saved_at': cookie_data['saved_at'],
+            'user_agent': cookie_data.get('user_agent'),
+            'cookie_count': len(cookie_data.get('cookies', []))
+        }
+    
     def load_cookies(self, domain: str) -> Optional[Dict[str, Any]]:
         """
         Load cookies from storage
@@ -116,11 +183,7 @@ class CookieStorage:
                 return None
             
             # Read and decrypt
-            with open(self.file_path, 'rb') as f:
-                encrypted_data = f.read()
-            
-            decrypted_data = self.cipher.decrypt(encrypted_data)
-            cookie_data = json.loads(decrypted_data.decode())
+            cookie_data = self._read_encrypted(self.file_path)
             
             # Check domain match
             if cookie_data.get('domain') != domain:
@@ -141,17 +204,24 @@ class CookieStorage:
             self.logger.error(f"Failed to load cookies: {e}")
             return None
     
-    def _is_expired(self, saved_at: datetime, max_age_hours: int = 24) -> bool:
+    def _is_expired(self, saved_at: datetime, max_age_hours: Optional[int] = None) -> bool:
         """
         Check if cookies are expired
         
         Args:
             saved_at: When cookies were saved
-            max_age_hours: Maximum age in hours
+            max_age_hours: Maximum age in hours (the storage's max_age_hours
+                if None)
             
         Returns:
             True if expired
         """
+        if max_age_hours is None:
+            max_age_hours = self.max_age_hours
+        
+        # The cutoff is recomputed on every call on purpose: AuthManager keeps
+        # one CookieStorage for the life of the app, so a cutoff cached at
+        # startup would stop cookies from ever expiring
         return datetime.now() - saved_at > timedelta(hours=max_age_hours)
     
     def clear_cookies(self) -> bool:
@@ -165,6 +235,8 @@ class CookieStorage:
             if self.file_path.exists():
                 self.file_path.unlink()
                 self.logger.info("Cleared stored cookies")
+            if self.meta_path.exists():
+                self.meta_path.unlink()
             return True
         except Exception as e:
             self.logger.error(f"Failed to clear cookies: {e}")
@@ -194,27 +266,22 @@ class CookieStorage:
             if not self.file_path.exists():
                 return None
             
-            with open(self.file_path, 'rb') as f:
-                encrypted_data = f.read()
-            
-            decrypted_data = self.cipher.decrypt(encrypted_data)
-            cookie_data = json.loads(decrypted_data.decode())
-            
-            saved_at = datetime.fromisoformat(cookie_data['saved_at'])
+            metadata = self._read_metadata()
+            saved_at = datetime.fromisoformat(metadata['saved_at'])
             
             return {
-                'domain': cookie_data.get('domain'),
+                'domain': metadata.get('domain'),
                 'saved_at': saved_at,
-                'cookie_count': len(cookie_data.get('cookies', [])),
+                'cookie_count': metadata.get('cookie_count', 0),
                 'expired': self._is_expired(saved_at),
-                'user_agent': cookie_data.get('user_agent')
+                'user_agent': metadata.get('user_agent')
             }
             
         except Exception as e:
             self.logger.error(f"Failed to get cookie info: {e}")
             return None
     
-    def update_expiry(self, max_age_hours: int = 24):
+    def update_expiry(self, max_age_hours: int = DEFAULT_MAX_AGE_HOURS):
         """
         Update the expiry check time
         
@@ -1,11 +1,19 @@
 """
 Comment data model for lottery web application
 """
+import re
+import hashlib
 from dataclasses import dataclass
+from functools import cached_property
 from datetime import datetime
 from typing import Optional, List
 
 
+# Mentioned usernames (letters, digits, '_' and '.')
+_MENTION_PATTERN = re.compile(r'@([a-zA-Z0-9_\.]+)')
+_find_mentions = _MENTION_PATTERN.findall
+
+
 @dataclass
 class Comment:
     """
@@ -34,9 +42,7 @@ class Comment:
         Extract mentioned usernames from comment content
         Returns list of usernames (without @ symbol)
         """
-        import re
-        mention_pattern = r'@([a-zA-Z0-9_\.]+)'
-        mentions = re.findall(mention_pattern, self.content)
+        mentions = _find_mentions(self.content)
         # Remove duplicates and self-mentions
         unique_mentions = list(set(mentions))
         if self.username in unique_mentions:
@@ -44,6 +50,20 @@ class Comment:
         self.mentions = unique_mentions
         return unique_mentions
     
+    @cached_property
+    def dedup_key(self) -> bytes:
+        """
+        Key under which comments with the same username and content collapse
+        
+        A 16-byte digest of the case-folded username and stripped content,
+        computed once per comment so repeated duplicate checks do not
+        re-fold the comment body.
+        """
+        digest = hashlib.blake2b(self.username.casefold().encode(), digest_size=16)
+        digest.update(b'\x00')
+        digest.update(self.content.strip().casefold().encode())
+        return digest.digest()
+    
     def contains_keyword(self, keyword: str, case_sensitive: bool = False) -> bool:
         """
         Check if comment contains specific keyword
@@ -3,7 +3,7 @@ Lottery result data model for lottery web application
 """
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 from enum import Enum
 import uuid
 
@@ -45,6 +45,13 @@ class LotteryResult:
     total_participants: int = 0
     eligible_count: int = 0
     
+    # Usernames already in all_participants, for constant-time duplicate checks
+    _participant_usernames: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Index the usernames of participants passed to the constructor"""
+        self._participant_usernames = {p.username for p in self.all_participants}
+    
     @property
     def mode_name(self) -> str:
         """Get human-readable mode name"""
@@ -58,7 +65,8 @@ class LotteryResult:
     def add_participant(self, comment: Comment):
         """Add a participant comment"""
         # Avoid duplicates based on username
-        if not any(p.username == comment.username for p in self.all_participants):
+        if comment.username not in self._participant_usernames:
+            self._participant_usernames.add(comment.username)
             self.all_participants.append(comment)
     
     def filter_eligible_participants(self):
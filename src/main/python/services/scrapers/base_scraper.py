@@ -2,11 +2,15 @@
 Base scraper class for web scraping functionality
 """
 import time
+import asyncio
+import threading
+import hashlib
 import logging
 from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any
 from urllib.parse import urlparse
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 
 from ...models import Comment
@@ -22,6 +26,13 @@ class BaseScraper(ABC):
     Abstract base class for web scrapers
     """
     
+    # Maximum number of requests run concurrently by the async helpers
+    MAX_CONCURRENT_REQUESTS = 4
+    
+    # Keep-alive pool sizes for the session: hosts kept, connections per host
+    POOL_CONNECTIONS = 10
+    POOL_MAXSIZE = 20
+    
     def __init__(self, timeout: int = 30, delay: float = 2.0, retry_attempts: int = 3):
         """
         Initialize base scraper
@@ -34,14 +45,24 @@ class BaseScraper(ABC):
         self.timeout = timeout
         self.delay = delay
         self.retry_attempts = retry_attempts
+        self._request_slots = threading.BoundedSemaphore(self.MAX_CONCURRENT_REQUESTS)
         self.session = self._create_session()
         self.logger = self._setup_logger()
     
     def _create_session(self) -> requests.Session:
         """
         Create and configure requests session
+        
+        Every request goes through this one session so TCP/TLS connections
+        are reused via keep-alive instead of being re-established per page.
         """
         session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
         session.headers.update({
             'User-Agent': (
                 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
@@ -108,17 +129,92 @@ class BaseScraper(ABC):
                     raise ScrapingError(f"Failed to fetch {url} after {self.retry_attempts} attempts: {e}")
                 time.sleep(self.delay * (attempt + 1))  # Exponential backoff
     
+    def _run_limited(self, func, /, *args, **kwargs) -> Any:
+        """
+        Call func while holding one of this scraper's request slots
+        
+        The slots are a per-instance threading semaphore taken in the worker
+        thread, so every async helper shares the MAX_CONCURRENT_REQUESTS
+        limit regardless of which event loop it is awaited from.
+        
+        Returns:
+            Result of func
+        """
+        with self._request_slots:
+            return func(*args, **kwargs)
+    
+    async def make_request_async(self, url: str, **kwargs) -> Any:
+        """
+        Run _make_request in a worker thread without blocking the event loop
+        
+        Concurrency is bounded by MAX_CONCURRENT_REQUESTS, shared with
+        scrape_urls.
+        
+        Args:
+            url: URL to request
+            **kwargs: Additional arguments for _make_request
+            
+        Returns:
+            Result of _make_request
+        """
+        return await asyncio.to_thread(self._run_limited, self._make_request, url, **kwargs)
+    
+    async def scrape_urls(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        Scrape several post URLs concurrently
+        
+        Concurrency is bounded by MAX_CONCURRENT_REQUESTS, shared with
+        make_request_async.
+        
+        Args:
+            urls: Post URLs to scrape
+            
+        Returns:
+            List of scrape_with_metadata results, in the same order as urls
+        """
+        return await asyncio.gather(*(
+            asyncio.to_thread(self._run_limited, self.scrape_with_metadata, url)
+            for url in urls
+        ))
+    
+    @staticmethod
+    def _comment_id(prefix: str, content: str, username: str) -> str:
+        """
+        Build a comment ID from its content and author
+        
+        The strings are fed to blake2b one after another rather than hashed
+        as a concatenated copy, and the ID is stable across processes
+        (unlike the randomized builtin hash()).
+        
+        Args:
+            prefix: ID prefix identifying the extraction strategy
+            content: Comment text
+            username: Comment author
+            
+        Returns:
+            Comment ID string
+        """
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update(content.encode())
+        digest.update(b'\x00')
+        digest.update(username.encode())
+        return f"{prefix}_{digest.hexdigest()}"
+    
     def _parse_html(self, html_content: str) -> BeautifulSoup:
         """
         Parse HTML content using BeautifulSoup
         
+        Uses the lxml parser (already a project dependency), which is much
+        faster than html.parser on large pages. Callers parse each page once
+        and pass the tree to every extraction strategy.
+        
         Args:
             html_content: HTML content string
             
         Returns:
             BeautifulSoup object
         """
-        return BeautifulSoup(html_content, 'html.parser')
+        return BeautifulSoup(html_content, 'lxml')
     
     @abstractmethod
     def validate_url(self, url: str) -> bool:
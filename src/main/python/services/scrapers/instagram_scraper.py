@@ -203,7 +203,7 @@ class InstagramScraper(BaseScraper):
                 timestamp = datetime.fromtimestamp(created_at)
             
             comment = Comment(
-                id=node.get('id', f"ig_{hash(text + username)}"),
+                id=node.get('id') or self._comment_id("ig", text, username),
                 username=username,
                 content=text,
                 avatar_url=profile_pic_url,
@@ -277,7 +277,7 @@ class InstagramScraper(BaseScraper):
             avatar_url = owner.get('profile_pic_url') or owner.get('profile_picture')
             
             comment = Comment(
-                id=data.get('id', f"ig_json_{hash(text + username)}"),
+                id=data.get('id') or self._comment_id("ig_json", text, username),
                 username=username,
                 content=text,
                 avatar_url=avatar_url,
@@ -340,7 +340,7 @@ class InstagramScraper(BaseScraper):
                     username = username_element.get_text(strip=True).lstrip('@')
             
             comment = Comment(
-                id=f"ig_html_{hash(text_content + username)}",
+                id=self._comment_id("ig_html", text_content, username),
                 username=username,
                 content=text_content,
                 platform="instagram",
@@ -394,7 +394,7 @@ class InstagramScraper(BaseScraper):
         unique_comments = []
         
         for comment in comments:
-            key = (comment.username.lower(), comment.content.lower().strip())
+            key = comment.dedup_key
             if key not in seen:
                 seen.add(key)
                 unique_comments.append(comment)
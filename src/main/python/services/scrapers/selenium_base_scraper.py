@@ -2,6 +2,8 @@
 Selenium-based base scraper for handling modern web applications
 """
 import time
+import socket
+import threading
 import logging
 from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any
@@ -13,7 +15,7 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from ...models import Comment
 from .base_scraper import BaseScraper, ScrapingError
@@ -24,13 +26,21 @@ class SeleniumBaseScraper(BaseScraper):
     Base class for Selenium-powered web scrapers
     """
     
+    # Low-level network failures worth retrying (connection reset, DNS lookup)
+    TRANSIENT_NETWORK_ERRORS = (ConnectionError, socket.gaierror)
+    
+    # A single WebDriver session can only serve one navigation at a time
+    MAX_CONCURRENT_REQUESTS = 1
+    
     def __init__(
         self, 
         timeout: int = 30, 
         delay: float = 2.0, 
         retry_attempts: int = 3,
         headless: bool = True,
-        window_size: tuple = (1920, 1080)
+        window_size: tuple = (1920, 1080),
+        user_data_dir: Optional[str] = None,
+        remote_url: Optional[str] = None
     ):
         """
         Initialize Selenium base scraper
@@ -41,6 +51,12 @@ class SeleniumBaseScraper(BaseScraper):
             retry_attempts: Number of retry attempts
             headless: Run browser in headless mode
             window_size: Browser window size (width, height)
+            user_data_dir: Chrome profile directory to reuse across runs, so
+                cookies and local storage survive restarts (a fresh temporary
+                profile is used if None)
+            remote_url: Selenium Grid / standalone-chrome endpoint (e.g.
+                http://localhost:4444) to drive an already running browser
+                service instead of launching a local chromedriver
         """
         # Initialize base class without session (we'll use WebDriver instead)
         self.timeout = timeout
@@ -48,8 +64,11 @@ class SeleniumBaseScraper(BaseScraper):
         self.retry_attempts = retry_attempts
         self.headless = headless
         self.window_size = window_size
+        self.user_data_dir = user_data_dir
+        self.remote_url = remote_url
+        self._request_slots = threading.BoundedSemaphore(self.MAX_CONCURRENT_REQUESTS)
         
-        self.driver: Optional[webdriver.Chrome] = None
+        self.driver: Optional[webdriver.Remote] = None
         self.wait: Optional[WebDriverWait] = None
         self.logger = self._setup_logger()
         
@@ -77,6 +96,10 @@ class SeleniumBaseScraper(BaseScraper):
             chrome_options.add_argument('--disable-plugins')
             chrome_options.add_argument('--disable-images')  # Faster loading
             
+            # Persistent profile: Chrome restores its own cookies at launch
+            if self.user_data_dir:
+                chrome_options.add_argument(f'--user-data-dir={self.user_data_dir}')
+            
             # User agent for better compatibility
             chrome_options.add_argument(
                 '--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
@@ -89,6 +112,13 @@ class SeleniumBaseScraper(BaseScraper):
                 'intl.accept_languages': 'zh-TW,zh,en'
             })
             
+            if self.remote_url:
+                self._start_driver(
+                    webdriver.Remote(command_executor=self.remote_url, options=chrome_options)
+                )
+                self.logger.info(f"Connected to remote WebDriver at {self.remote_url}")
+                return
+            
             # Try to find and use ChromeDriver
             service = None
             chromedriver_path = None
@@ -146,9 +176,7 @@ class SeleniumBaseScraper(BaseScraper):
             if not service:
                 raise Exception("No valid ChromeDriver found. Please install Chrome browser and ensure chromedriver is in PATH.")
             
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.driver.implicitly_wait(10)
-            self.wait = WebDriverWait(self.driver, self.timeout)
+            self._start_driver(webdriver.Chrome(service=service, options=chrome_options))
             
             self.logger.info("Chrome WebDriver initialized successfully")
             
@@ -156,6 +184,17 @@ class SeleniumBaseScraper(BaseScraper):
             self.logger.error(f"Failed to initialize WebDriver: {e}")
             raise ScrapingError(f"WebDriver initialization failed: {e}")
     
+    def _start_driver(self, driver: webdriver.Remote):
+        """
+        Adopt a freshly created WebDriver and set up its waits
+        
+        Args:
+            driver: Local Chrome or remote WebDriver session
+        """
+        self.driver = driver
+        self.driver.implicitly_wait(10)
+        self.wait = WebDriverWait(self.driver, self.timeout)
+    
     def _make_request(self, url: str, **kwargs) -> str:
         """
         Navigate to URL and return page source
@@ -167,6 +206,22 @@ class SeleniumBaseScraper(BaseScraper):
         Returns:
             Page source HTML
             
+        Raises:
+            ScrapingError: If navigation fails
+        """
+        self._navigate(url)
+        return self.driver.page_source
+    
+    def _navigate(self, url: str):
+        """
+        Navigate to URL and wait for the page body, retrying transient failures
+        
+        Unlike _make_request this does not pull the (often multi-MB) page
+        source across the WebDriver wire.
+        
+        Args:
+            url: URL to navigate to
+            
         Raises:
             ScrapingError: If navigation fails
         """
@@ -183,23 +238,32 @@ class SeleniumBaseScraper(BaseScraper):
                 # Additional delay for JavaScript execution
                 time.sleep(self.delay)
                 
-                return self.driver.page_source
+                return
                 
             except TimeoutException as e:
                 self.logger.warning(f"Page load timeout (attempt {attempt + 1}): {e}")
                 if attempt == self.retry_attempts - 1:
                     raise ScrapingError(f"Page load timeout after {self.retry_attempts} attempts")
+                
+                # Exponential backoff
+                time.sleep(self.delay * (attempt + 1))
             except WebDriverException as e:
                 self.logger.warning(f"WebDriver error (attempt {attempt + 1}): {e}")
                 if attempt == self.retry_attempts - 1:
                     raise ScrapingError(f"WebDriver error after {self.retry_attempts} attempts: {e}")
-            except Exception as e:
-                self.logger.warning(f"Navigation failed (attempt {attempt + 1}): {e}")
+                
+                time.sleep(self.delay * (attempt + 1))
+            except self.TRANSIENT_NETWORK_ERRORS as e:
+                self.logger.warning(f"Network error (attempt {attempt + 1}): {e}")
                 if attempt == self.retry_attempts - 1:
-                    raise ScrapingError(f"Navigation failed after {self.retry_attempts} attempts: {e}")
+                    raise ScrapingError(f"Network error after {self.retry_attempts} attempts: {e}")
                 
-                # Exponential backoff
                 time.sleep(self.delay * (attempt + 1))
+            except Exception as e:
+                # Non-transient errors (bad URL, programming errors) will not
+                # succeed on retry, so surface them immediately
+                self.logger.error(f"Navigation failed: {e}")
+                raise ScrapingError(f"Navigation failed: {e}")
     
     def wait_for_element(
         self, 
@@ -268,18 +332,19 @@ class SeleniumBaseScraper(BaseScraper):
             
         self.logger.info(f"Completed {scrolls} scrolls")
     
-    def execute_script(self, script: str) -> Any:
+    def execute_script(self, script: str, *args) -> Any:
         """
         Execute JavaScript in the browser
         
         Args:
             script: JavaScript code to execute
+            *args: Values exposed to the script as arguments[0], arguments[1], ...
             
         Returns:
             Result of script execution
         """
         try:
-            return self.driver.execute_script(script)
+            return self.driver.execute_script(script, *args)
         except Exception as e:
             self.logger.warning(f"Script execution failed: {e}")
             return None
@@ -301,14 +366,30 @@ class SeleniumBaseScraper(BaseScraper):
             self.logger.debug(f"Failed to find elements with selector '{selector}': {e}")
             return []
     
-    def get_soup(self) -> BeautifulSoup:
+    def get_soup(
+        self,
+        page_source: Optional[str] = None,
+        parse_only: Optional[SoupStrainer] = None
+    ) -> BeautifulSoup:
         """
         Get BeautifulSoup object from current page
         
+        Uses the lxml parser (already a project dependency), which is much
+        faster than html.parser on large rendered DOMs.
+        
+        Args:
+            page_source: Previously captured page source; read from the
+                driver if omitted. Passing it in lets the parse run off the
+                thread that owns the driver.
+            parse_only: Optional strainer limiting which parts of the
+                document are built into the tree
+        
         Returns:
             BeautifulSoup object
         """
-        return BeautifulSoup(self.driver.page_source, 'html.parser')
+        if page_source is None:
+            page_source = self.driver.page_source
+        return BeautifulSoup(page_source, 'lxml', parse_only=parse_only)
     
     def cleanup(self):
         """
@@ -3,12 +3,14 @@ Selenium-based Threads scraper for handling dynamic content
 """
 import re
 import time
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Callable
 from datetime import datetime, timedelta
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from urllib.parse import urlparse
+from bs4 import SoupStrainer
 
 from ...models import Comment
 from .selenium_base_scraper import SeleniumBaseScraper, ScrapingError
@@ -16,6 +18,109 @@ from ...auth import AuthManager
 from ...config.auth_config import auth_config
 
 
+# @username mentions, shared by every extraction strategy; .search is
+# pre-bound because it runs once per candidate element
+_MENTION_RE = re.compile(r'@(\w+)')
+_mention_search = _MENTION_RE.search
+
+# 'username comment text' at the start of a fragment of flattened page text
+# that followed an '@'; the text runs to the end of the line (fragments are
+# split on '@', so they never contain one)
+_MENTION_BODY_RE = re.compile(r'(\w+)\s+([^\n]+)')
+_mention_body_match = _MENTION_BODY_RE.match
+
+# Username in a profile link such as https://www.threads.net/@user/post/...
+_HREF_USER_RE = re.compile(r'/@([^/?]+)')
+
+# jQuery/Playwright-only pseudo-classes that querySelectorAll rejects
+_NON_CSS_PSEUDO_CLASSES = (':contains(', ':has-text(')
+
+
+# Plain substring attribute selectors such as 'span[class*="time"]'
+_ATTR_CONTAINS_RE = re.compile(r'^([\w-]*)\[([\w-]+)\*="([^"]*)"\]$')
+
+
+def _css_selectors(selectors: List[str]) -> List[str]:
+    """
+    Drop duplicates and selectors querySelectorAll would reject, keeping order
+    """
+    return list(dict.fromkeys(
+        selector for selector in selectors
+        if not any(pseudo in selector for pseudo in _NON_CSS_PSEUDO_CLASSES)
+    ))
+
+
+def _css_union(selectors: List[str]) -> str:
+    """
+    Join selectors into a single CSS selector list
+    
+    One invalid selector makes querySelectorAll reject the whole list, so
+    selectors using non-standard pseudo-classes are left out. Duplicates,
+    and substring attribute selectors already covered by a shorter one
+    (e.g. [class*="timestamp"] next to [class*="time"]), are dropped as
+    well, since the browser would test them against every element.
+    
+    Only use this where every selector is equally good: the union returns
+    matches in document order, not selector order.
+    """
+    valid = _css_selectors(selectors)
+    
+    contains = [match.groups() for match in map(_ATTR_CONTAINS_RE.match, valid) if match]
+    
+    def is_redundant(selector: str) -> bool:
+        match = _ATTR_CONTAINS_RE.match(selector)
+        if not match:
+            return False
+        tag, attr, value = match.groups()
+        return any(
+            other_attr == attr and other_tag in ('', tag)
+            and other_value != value and other_value in value
+            for other_tag, other_attr, other_value in contains
+        )
+    
+    return ",".join(
+        selector for selector in valid
+        if not is_redundant(selector)
+    )
+
+
+# Absolute timestamp formats tried in order; the day/month ambiguity
+# between the last four means the order is significant
+_DATETIME_FORMATS = (
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d %H:%M',
+    '%Y-%m-%d',
+    '%m/%d/%Y %H:%M',
+    '%m/%d/%Y',
+    '%d/%m/%Y %H:%M',
+    '%d/%m/%Y',
+)
+
+
+@lru_cache(maxsize=1024)
+def _parse_datetime_value(datetime_str: str) -> Optional[datetime]:
+    """
+    Parse an absolute timestamp string, memoised per input
+    
+    Comments on a page tend to repeat the same few timestamps, so the
+    strptime format trials run once per distinct string.
+    
+    Raises:
+        ValueError: If an ISO timestamp is malformed
+    """
+    # ISO format
+    if 'T' in datetime_str:
+        return datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
+    
+    for fmt in _DATETIME_FORMATS:
+        try:
+            return datetime.strptime(datetime_str, fmt)
+        except ValueError:
+            continue
+    
+    return None
+
+
 class SeleniumThreadsScraper(SeleniumBaseScraper):
     """
     Selenium-powered scraper for Threads posts with authentication support
@@ -23,12 +128,23 @@ class SeleniumThreadsScraper(SeleniumBaseScraper):
     
     THREADS_DOMAINS = ['threads.com', 'www.threads.com', 'threads.net', 'www.threads.net']
     
+    # Post URL on one of THREADS_DOMAINS with '/post/' in its path
+    _THREADS_URL_RE = re.compile(
+        r'^https?://(?:' + '|'.join(re.escape(domain) for domain in THREADS_DOMAINS) + r')'
+        r'/(?:[^?#]*/)?post/',
+        re.IGNORECASE
+    )
+    
+    # First path segment after 'post'
+    _POST_ID_RE = re.compile(r'^[^?#]*?/post/([^/?#]+)')
+    
     def __init__(self, *args, **kwargs):
         """Initialize Selenium Threads scraper with authentication support"""
         super().__init__(*args, **kwargs)
         
         # Initialize authentication manager
         self.auth_manager = AuthManager(auth_config)
+        
         self.logger.info("Initialized Selenium Threads scraper with authentication support")
     
     # Improved selectors for Threads comment elements
@@ -55,9 +171,12 @@ class SeleniumThreadsScraper(SeleniumBaseScraper):
         # Comment thread patterns
         'div[class*="x"]:has(a[href*="/@"]):has(span)',
         'div[class*="thread"]:has(a[href*="/@"])',
-        
-        # Fallback: General content with user mentions
-        'div:contains("@"):has(a[href*="/@"])',
+    ]
+    
+    # Fallback: General content with user mentions (jQuery ":contains" has
+    # no CSS equivalent, so these are expressed as XPath locators)
+    FALLBACK_COMMENT_LOCATORS = [
+        (By.XPATH, '//div[contains(., "@")][.//a[contains(@href, "/@")]]'),
     ]
     
     USERNAME_SELECTORS = [
@@ -72,16 +191,150 @@ class SeleniumThreadsScraper(SeleniumBaseScraper):
         '[class*="username"]',
         '[class*="user"]',
         
-        # Text content patterns
-        'span:contains("@")',
-        'div:contains("@")',
-        
         # Structural patterns
         'img[alt*="profile"] + span',
         'img[alt*="avatar"] + span',
         'img + div > span:first-child',
     ]
     
+    # Text content patterns (jQuery ":contains" rewritten as relative XPath)
+    FALLBACK_USERNAME_XPATHS = [
+        './/span[contains(., "@")]',
+        './/div[contains(., "@")]',
+    ]
+    
+    # Elements with a direct text node containing '@' (first 50 only)
+    MENTION_XPATH = (
+        '(//body//*[not(self::script or self::style)]'
+        '[text()[contains(., "@")]])[position() <= 50]'
+    )
+    
+    # Elements that typically appear once comments have rendered
+    COMMENT_INDICATOR_SELECTOR = (
+        'a[href*="/@"], [data-testid*="comment"], [role="article"], time, [datetime]'
+    )
+    LOADING_INDICATOR_SELECTOR = '[aria-label*="loading"], [data-testid*="loading"], .loading'
+    
+    # Seconds to poll for comments / loading spinners before giving up
+    COMMENT_WAIT_TIMEOUT = 3
+    
+    # After each scroll, the page is considered settled once the number of
+    # username links and the page height are unchanged for SCROLL_STABLE_POLLS
+    # consecutive polls (bounded by SCROLL_SETTLE_TIMEOUT seconds)
+    SCROLL_POLL_INTERVAL = 0.2
+    SCROLL_STABLE_POLLS = 3
+    SCROLL_SETTLE_TIMEOUT = 8
+    
+    # Upper bound on elements handed back by one extraction pass; Threads
+    # nests articles inside articles, so broad selectors can match hundreds
+    MAX_COMMENT_ELEMENTS = 200
+    
+    # Page and comment readiness are probed with scripts rather than
+    # find_elements, which would block on the driver's implicit wait
+    _COMMENTS_READY_SCRIPT = """
+    return document.readyState === 'complete'
+        && document.querySelectorAll(arguments[0]).length > 0;
+    """
+    
+    _DOM_SIZE_SCRIPT = """
+    return [document.querySelectorAll('a[href*="/@"]').length, document.body.scrollHeight];
+    """
+    
+    _IS_VISIBLE_SCRIPT = """
+    return Array.prototype.some.call(document.querySelectorAll(arguments[0]), function (el) {
+        return el.offsetParent !== null;
+    });
+    """
+    
+    # Markup of the main content region only, so the BeautifulSoup fallback
+    # does not parse scripts, styles and preloaded JSON elsewhere on the page
+    _MAIN_HTML_SCRIPT = """
+    var root = document.querySelector('[role="main"]') || document.body;
+    return root ? root.outerHTML : null;
+    """
+    
+    # Text that indicates a login wall (matched case-insensitively)
+    LOGIN_INDICATORS = [
+        "log in",
+        "sign up",
+        "登入",
+        "註冊",
+        "login",
+        "sign-up",
+    ]
+    
+    # All indicators as one alternation, built once at class load; the
+    # probe tests it in a single case-insensitive pass over the page text,
+    # without building a lowercased copy of it
+    _LOGIN_INDICATOR_PATTERN = '|'.join(re.escape(indicator) for indicator in LOGIN_INDICATORS)
+    _LOGIN_PROBE_SCRIPT = """
+    return new RegExp(arguments[0], 'i').test(document.body ? document.body.innerText : '');
+    """
+    
+    # Login / auth redirects
+    _LOGIN_URL_RE = re.compile(r'login|auth', re.IGNORECASE)
+    
+    # Whether the page text holds any '@' at all; both fallback strategies
+    # need one, so without it the page source is never transferred
+    _HAS_MENTION_SCRIPT = """
+    return !!document.body && (document.body.textContent || '').indexOf('@') !== -1;
+    """
+    
+    # Precompiled patterns used while parsing every comment element
+    _WS_RE = re.compile(r'\s+')
+    _NONWORD_RE = re.compile(r'[^\w\s]')
+    
+    # Common UI labels that leak into scraped comment text ('Reply',
+    # '5 likes', '追蹤' ...). They are only removed where they stand alone:
+    # a line holding nothing but labels, or a trailing run that starts with
+    # a like/reply counter. The same words inside a sentence are part of
+    # the comment and are kept.
+    _UI_COUNTER = r'\d+\s*(?:likes?|replies?|個讚|則回覆)'
+    _UI_LABEL = (
+        rf'(?:{_UI_COUNTER}'
+        r'|liked|like|reply|share|more|關於|回覆|分享|更多'
+        r'|(?:view|查看)\s*(?:profile|個人檔案)'
+        r'|follow|追蹤|following|已追蹤)'
+    )
+    _UI_LINE_RE = re.compile(
+        rf'^[^\S\n]*(?:{_UI_LABEL}[^\S\n]*)+$\n?', re.IGNORECASE | re.MULTILINE
+    )
+    _UI_TRAILING_RE = re.compile(
+        rf'\s+{_UI_COUNTER}(?:\s*{_UI_LABEL})*\s*$', re.IGNORECASE
+    )
+    
+    # Relative time expressions ('2h', '3 天' ...); the named group that
+    # matched is the unit. Months come before minutes so '3mo' is not
+    # read as three minutes. A Latin unit must not run on into another
+    # letter, so ordinary words such as '2 dogs' or '3 more' are not read
+    # as days or months (CJK units are routinely followed by '前').
+    _RELATIVE_TIME_RE = re.compile(
+        r'(\d+)\s*(?:'
+        r'(?P<months>mo(?:nth)?s?|月)'
+        r'|(?P<seconds>s(?:ec(?:ond)?s?)?|秒)'
+        r'|(?P<minutes>m(?:in(?:ute)?s?)?|分(?:鐘)?)'
+        r'|(?P<hours>h(?:r|our)?s?|小時)'
+        r'|(?P<days>d(?:ay)?s?|天)'
+        r'|(?P<weeks>w(?:eek)?s?|週)'
+        r'|(?P<years>y(?:ear)?s?|年)'
+        r')(?![a-z])',
+        re.IGNORECASE
+    )
+    
+    # Relative time unit -> timedelta for a value of 1
+    _RELATIVE_TIME_UNITS = {
+        'seconds': timedelta(seconds=1),
+        'minutes': timedelta(minutes=1),
+        'hours': timedelta(hours=1),
+        'days': timedelta(days=1),
+        'weeks': timedelta(weeks=1),
+        'months': timedelta(days=30),  # Approximation
+        'years': timedelta(days=365),  # Approximation
+    }
+    
+    # Longer strings are comment bodies rather than time labels
+    _MAX_RELATIVE_TIME_LENGTH = 32
+    
     # Timestamp selectors for extracting post/comment time
     TIMESTAMP_SELECTORS = [
         # High priority: Semantic time elements
@@ -108,49 +361,203 @@ class SeleniumThreadsScraper(SeleniumBaseScraper):
         'span[title*=":"]',  # Often contains full timestamp
         'a[title*=":"]',
         
-        # Relative time text patterns (English)
-        'span[textContent*="h"]',
-        'span[textContent*="m"]', 
-        'span[textContent*="d"]',
-        'span[textContent*="w"]',
-        
-        # Relative time text patterns (Chinese)
-        'span[textContent*="小時"]',
-        'span[textContent*="分鐘"]',
-        'span[textContent*="天"]',
-        'span[textContent*="週"]',
-        'span[textContent*="秒"]',
+        # Relative time text ('2h', '3 天') is not selectable with CSS (there
+        # is no textContent attribute); _extract_time_from_text covers it
         
         # Generic patterns for small text near username
         'a[href*="/@"] + span',
         'a[href*="/@"] ~ span:last-child',
     ]
     
+    # Username selectors in priority order; a union would return nodes in
+    # document order, so a broad [class*="user"] wrapper around the whole
+    # comment would win over the inner username node
+    _USERNAME_CSS_SELECTORS = _css_selectors(USERNAME_SELECTORS)
+    
+    # Selector lists joined once at class load for single-call queries
+    _TIMESTAMP_CSS_UNION = _css_union(TIMESTAMP_SELECTORS)
+    
+    # Comment locators in priority order, as [query, isXPath] pairs for the
+    # extraction script. Each selector stays a separate locator: a union
+    # would return matches in document order, so broad selectors such as
+    # 'div:has(a[href*="/@"]):has(span)' would put the page's wrapper divs
+    # ahead of the real comment nodes
+    _COMMENT_LOCATORS = [[selector, False] for selector in _css_selectors(COMMENT_SELECTORS)] + [
+        [selector, by == By.XPATH] for by, selector in FALLBACK_COMMENT_LOCATORS
+    ]
+    
+    # Number of mention nodes used by the last-resort fallback
+    MAX_MENTION_ELEMENTS = 20
+    
+    # The BeautifulSoup fallback only reads visible text, so <head> (styles,
+    # preloaded JSON, meta tags) is never built into the tree
+    _BODY_STRAINER = SoupStrainer('body')
+    
+    # Collects everything the Selenium strategy needs in a single round-trip:
+    # the raw fields of the elements matched by the first locator (in
+    # order, from startIndex) that finds any text, plus the text of the
+    # mention fallback nodes (first call only). Arguments: locators
+    # ([query, isXPath] pairs), usernameSelectors, usernameXPaths,
+    # timestampSelector, maxElements, mentionXPath, mentionLimit,
+    # startIndex. Only the comment body uses the rendered innerText;
+    # usernames, timestamps and mentions are matched against textContent,
+    # which skips the layout/visibility walk
+    _COMMENT_EXTRACTION_SCRIPT = """
+    var locators = arguments[0];
+    var usernameSelectors = arguments[1], usernameXPaths = arguments[2];
+    var timestampSelector = arguments[3], maxElements = arguments[4];
+    var mentionXPath = arguments[5], mentionLimit = arguments[6];
+    var startIndex = arguments[7];
+    
+    function xpathNodes(xpath, context, limit) {
+        var snapshot = document.evaluate(
+            xpath, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        var count = Math.min(snapshot.snapshotLength, limit || Infinity);
+        var nodes = [];
+        for (var i = 0; i < count; i++) {
+            nodes.push(snapshot.snapshotItem(i));
+        }
+        return nodes;
+    }
+    
+    function firstText(nodes) {
+        for (var i = 0; i < nodes.length; i++) {
+            var text = (nodes[i].textContent || '').trim();
+            if (text) {
+                return text;
+            }
+        }
+        return null;
+    }
+    
+    // Text of the first node matched by the first username selector (in
+    // priority order) that yields any, then the XPath fallbacks
+    function usernameText(el) {
+        for (var i = 0; i < usernameSelectors.length; i++) {
+            var node = el.querySelector(usernameSelectors[i]);
+            var text = node ? (node.textContent || '').trim() : '';
+            if (text) {
+                return text;
+            }
+        }
+        for (var j = 0; j < usernameXPaths.length; j++) {
+            var nodes = xpathNodes(usernameXPaths[j], el);
+            if (nodes.length) {
+                return firstText(nodes);
+            }
+        }
+        return null;
+    }
+    
+    function avatarSrc(el) {
+        var images = el.querySelectorAll('img'), first = null;
+        for (var i = 0; i < images.length; i++) {
+            var src = images[i].src;
+            if (src && /profile|avatar/i.test(src)) {
+                return src;
+            }
+            first = first || src;
+        }
+        return first;
+    }
+    
+    function hasText(el) {
+        return (el.innerText || '').trim().length >= 2;
+    }
+    
+    var elements = [], matchedLocator = null;
+    for (var k = startIndex; k < locators.length; k++) {
+        var query = locators[k][0], isXPath = locators[k][1];
+        elements = isXPath
+            ? xpathNodes(query, document, maxElements)
+            : Array.prototype.slice.call(document.querySelectorAll(query), 0, maxElements);
+        if (elements.some(hasText)) {
+            matchedLocator = k;
+            break;
+        }
+        elements = [];
+    }
+    
+    var mentions = startIndex > 0 ? [] : xpathNodes(mentionXPath, document, mentionLimit).map(function (node) {
+        return node.textContent || '';
+    });
+    
+    var data = elements.map(function (el) {
+        var link = el.querySelector('a[href*="/@"]');
+        
+        var nonEmptyTextCount = 0;
+        var textNodes = el.querySelectorAll('span, p, div');
+        for (var j = 0; j < textNodes.length; j++) {
+            if ((textNodes[j].innerText || '').trim()) {
+                nonEmptyTextCount++;
+            }
+        }
+        
+        return {
+            text: el.innerText || '',
+            href: link ? link.href : null,
+            mediaCount: el.querySelectorAll('img, video, svg').length,
+            nonEmptyTextCount: nonEmptyTextCount,
+            usernameText: usernameText(el),
+            avatar: avatarSrc(el),
+            timestamps: Array.prototype.map.call(el.querySelectorAll(timestampSelector), function (ts) {
+                var datetimeAttr = ts.getAttribute('datetime');
+                var dateMs = datetimeAttr ? Date.parse(datetimeAttr) : NaN;
+                return {
+                    dateMs: isNaN(dateMs) ? null : dateMs,
+                    datetime: datetimeAttr,
+                    title: ts.getAttribute('title'),
+                    text: (ts.textContent || '').trim()
+                };
+            })
+        };
+    });
+    
+    return {elements: data, matchedLocator: matchedLocator, mentions: mentions};
+    """
+    
+    # Last-resort scan for comment-like containers holding an @mention;
+    # stops once `limit` (arguments[0]) candidates have been found
+    _COMMENT_SCAN_SCRIPT = """
+    var limit = arguments[0];
+    var comments = [];
+    var allElements = document.querySelectorAll('div, article, section');
+    
+    for (var i = 0; i < allElements.length && comments.length < limit; i++) {
+        var text = allElements[i].textContent || '';
+        
+        // Look for elements that might be comments
+        if (text.length > 10 && text.length < 1000 && text.includes('@')) {
+            var usernameMatch = text.match(/@(\\w+)/);
+            if (usernameMatch) {
+                comments.push({
+                    username: usernameMatch[1],
+                    content: text.trim()
+                });
+            }
+        }
+    }
+    
+    return comments;
+    """
+    
     def validate_url(self, url: str) -> bool:
         """
         Validate if URL is a Threads post URL
         """
-        try:
-            parsed = urlparse(url)
-            return (
-                parsed.netloc.lower() in self.THREADS_DOMAINS and
-                '/post/' in parsed.path
-            )
-        except Exception:
+        if not isinstance(url, str):
             return False
+        return bool(self._THREADS_URL_RE.match(url))
     
     def extract_post_id(self, url: str) -> str:
         """
         Extract post ID from Threads URL
         """
-        try:
-            path_parts = urlparse(url).path.split('/')
-            post_index = path_parts.index('post')
-            if post_index + 1 < len(path_parts):
-                return path_parts[post_index + 1]
-            raise ValueError("Post ID not found in URL")
-        except (ValueError, IndexError) as e:
-            raise ScrapingError(f"Invalid Threads URL format: {e}")
+        match = self._POST_ID_RE.search(url)
+        if not match:
+            raise ScrapingError("Invalid Threads URL format: Post ID not found in URL")
+        return match.group(1)
     
     def scrape_comments(self, url: str) -> List[Comment]:
         """
@@ -162,8 +569,9 @@ class SeleniumThreadsScraper(SeleniumBaseScraper):
         self.logger.info(f"Scraping Threads post with Selenium: {url}")
         
         try:
-            # Navigate to the URL
-            page_source = self._make_request(url)
+            # Navigate to the URL; extraction reads the live DOM, so the page
+            # source is not fetched here
+            self._navigate(url)
             
             # Check if authentication is required and handle it
             if self._check_login_required():
@@ -187,30 +595,51 @@ class SeleniumThreadsScraper(SeleniumBaseScraper):
             # Scroll to load more comments with improved strategy
             self._smart_scroll_for_comments()
             
-            # Extract comments using multiple strategies
-            comments = []
+            # The URL does not change during extraction, so read it only once
+            post_url = self.driver.current_url
+            
+            # Extract comments using multiple strategies; every strategy
+            # hands its comments to add(), which keeps only the first comment
+            # seen for each (username, content) pair
+            unique: Dict[bytes, Comment] = {}
+            
+            def add(comment: Comment) -> bool:
+                key = comment.dedup_key
+                if key in unique:
+                    return False
+                unique[key] = comment
+                return True
             
             # Strategy 1: Use Selenium to find dynamic elements
-            selenium_comments = self._extract_with_selenium()
+            selenium_comments = self._extract_with_selenium(post_url, add)
             if selenium_comments:
-                comments.extend(selenium_comments)
                 self.logger.info(f"Selenium extraction found {len(selenium_comments)} comments")
             
-            # Strategy 2: Parse current page source with BeautifulSoup
-            if not comments:
-                soup = self.get_soup()
-                soup_comments = self._extract_with_beautifulsoup(soup, url)
-                comments.extend(soup_comments)
+            # Both fallbacks need an '@' in the page text; ask the browser
+            # before transferring the page source (a failed probe returns
+            # None and does not skip anything)
+            if not unique and self.execute_script(self._HAS_MENTION_SCRIPT) is False:
+                self.logger.info("No @ mentions on the page, skipping fallback extraction")
+            elif not unique:
+                # Strategy 2: Parse current page source with BeautifulSoup
+                page_source = self.execute_script(self._MAIN_HTML_SCRIPT) or self.driver.page_source
+                soup = self.get_soup(page_source, parse_only=self._BODY_STRAINER)
+                soup_comments = self._extract_with_beautifulsoup(soup, url, add)
                 self.logger.info(f"BeautifulSoup extraction found {len(soup_comments)} comments")
-            
-            # Strategy 3: JavaScript-based extraction
-            if not comments:
-                js_comments = self._extract_with_javascript(url)
-                comments.extend(js_comments)
-                self.logger.info(f"JavaScript extraction found {len(js_comments)} comments")
-            
-            # Remove duplicates
-            unique_comments = self._deduplicate_comments(comments)
+                
+                # Strategy 3: JavaScript-based extraction. The full-page scan
+                # is the last resort, so it only runs when BeautifulSoup
+                # found nothing
+                if not unique:
+                    js_comments = self._extract_with_javascript(url, add)
+                    self.logger.info(f"JavaScript extraction found {len(js_comments)} comments")
+            
+            unique_comments = list(unique.values())
+            
+            # Mentions are only needed for comments that survived
+            # de-duplication
+            for comment in unique_comments:
+                comment.extract_mentions()
             
             self.logger.info(f"Total unique comments extracted: {len(unique_comments)}")
             return unique_comments
@@ -224,23 +653,15 @@ class SeleniumThreadsScraper(SeleniumBaseScraper):
         Check if the page requires login
         """
         try:
-            # Look for login indicators
-            login_indicators = [
-                "Log in",
-                "Sign up",
-                "登入",
-                "註冊",
-                "login",
-                "sign-up"
-            ]
-            
-            page_text = self.driver.page_source.lower()
-            login_detected = any(indicator.lower() in page_text for indicator in login_indicators)
-            
-            # Also check URL for login redirect
-            current_url = self.driver.current_url
-            if 'login' in current_url.lower() or 'auth' in current_url.lower():
-                login_detected = True
+            # A login redirect is visible from the URL alone
+            login_detected = bool(self._LOGIN_URL_RE.search(self.driver.current_url))
+            
+            # Otherwise scan the rendered text inside the browser so only a
+            # boolean crosses the WebDriver wire instead of the full page source
+            if not login_detected:
+                login_detected = bool(self.execute_script(
+                    self._LOGIN_PROBE_SCRIPT, self._LOGIN_INDICATOR_PATTERN
+                ))
             
             if login_detected:
                 self.logger.warning("Login page detected")
@@ -272,10 +693,7 @@ class SeleniumThreadsScraper(SeleniumBaseScraper):
             if self.wait_for_element(selector, timeout=15):
                 self.logger.info(f"Found content area with selector: {selector}")
                 
-                # Wait for content to fully load
-                time.sleep(3)
-                
-                # Additional check: wait for comments to appear
+                # Wait for content to fully load and comments to appear
                 if self._wait_for_comment_elements():
                     return True
         
@@ -287,29 +705,35 @@ class SeleniumThreadsScraper(SeleniumBaseScraper):
         Wait specifically for comment elements to appear
         """
         try:
-            # Wait for elements that typically contain comments
-            comment_indicators = [
-                'a[href*="/@"]',  # Username links
-                '[data-testid*="comment"]',
-                '[role="article"]',
-                'time, [datetime]',  # Timestamp elements
-            ]
-            
-            for indicator in comment_indicators:
-                try:
-                    elements = self.get_elements(indicator)
-                    if elements and len(elements) > 0:
-                        self.logger.info(f"Found {len(elements)} comment indicators with: {indicator}")
-                        return True
-                except:
-                    continue
+            # Poll until the document is loaded and comment indicators exist,
+            # returning as soon as they do instead of sleeping a fixed time
+            WebDriverWait(self.driver, self.COMMENT_WAIT_TIMEOUT, poll_frequency=0.25).until(
+                lambda driver: driver.execute_script(
+                    self._COMMENTS_READY_SCRIPT, self.COMMENT_INDICATOR_SELECTOR
+                )
+            )
+            self.logger.info("Found comment indicators")
+            return True
             
+        except TimeoutException:
             return False
-            
         except Exception as e:
             self.logger.debug(f"Error waiting for comment elements: {e}")
             return False
     
+    def _wait_for_loading_to_finish(self):
+        """
+        Wait until no loading indicator is visible
+        """
+        try:
+            WebDriverWait(self.driver, self.COMMENT_WAIT_TIMEOUT, poll_frequency=0.25).until_not(
+                lambda driver: driver.execute_script(
+                    self._IS_VISIBLE_SCRIPT, self.LOADING_INDICATOR_SELECTOR
+                )
+            )
+        except TimeoutException:
+            self.logger.debug("Loading indicator still visible, continuing")
+    
     def _smart_scroll_for_comments(self):
         """
         Smart scrolling strategy to load comments progressively
@@ -318,7 +742,7 @@ class SeleniumThreadsScraper(SeleniumBaseScraper):
             self.logger.info("Starting smart scroll to load comments...")
             
             # Get initial comment count
-            initial_count = len(self.get_elements('a[href*="/@"]'))
+            initial_count = self._wait_for_dom_to_settle()
             self.logger.info(f"Initial comment indicators found: {initial_count}")
             
             scroll_attempts = 0
@@ -328,16 +752,12 @@ class SeleniumThreadsScraper(SeleniumBaseScraper):
             while scroll_attempts < max_scrolls and no_new_content_count < 2:
                 # Scroll down
                 self.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
                 
-                # Check for loading indicators
-                loading_elements = self.get_elements('[aria-label*="loading"], [data-testid*="loading"], .loading')
-                if loading_elements:
-                    self.logger.info("Loading indicator found, waiting...")
-                    time.sleep(3)
+                # Wait for any loading indicator to disappear
+                self._wait_for_loading_to_finish()
                 
-                # Count new comment indicators
-                new_count = len(self.get_elements('a[href*="/@"]'))
+                # Count new comment indicators once the page stops changing
+                new_count = self._wait_for_dom_to_settle()
                 
                 if new_count > initial_count:
                     self.logger.info(f"Found {new_count - initial_count} new comment indicators")
@@ -348,10 +768,6 @@ class SeleniumThreadsScraper(SeleniumBaseScraper):
                     self.logger.debug(f"No new content found (attempt {no_new_content_count})")
                 
                 scroll_attempts += 1
-                
-                # Progressive wait - longer waits for later scrolls
-                wait_time = 2 + scroll_attempts * 0.5
-                time.sleep(wait_time)
             
             self.logger.info(f"Scroll complete. Final comment indicators: {initial_count}")
             
@@ -360,56 +776,126 @@ class SeleniumThreadsScraper(SeleniumBaseScraper):
             # Fallback to basic scroll
             self.scroll_to_load_content(max_scrolls=3, scroll_pause=2.0)
     
-    def _extract_with_selenium(self) -> List[Comment]:
+    def _wait_for_dom_to_settle(self) -> int:
+        """
+        Wait until the page stops growing after a scroll
+        
+        Returns:
+            Number of username links on the page once it has settled
+        """
+        deadline = time.monotonic() + self.SCROLL_SETTLE_TIMEOUT
+        last_size = None
+        stable_polls = 0
+        
+        while time.monotonic() < deadline:
+            size = self.execute_script(self._DOM_SIZE_SCRIPT) or [0, 0]
+            if size == last_size:
+                stable_polls += 1
+                if stable_polls >= self.SCROLL_STABLE_POLLS:
+                    break
+            else:
+                last_size = size
+                stable_polls = 0
+            time.sleep(self.SCROLL_POLL_INTERVAL)
+        
+        return last_size[0] if last_size else 0
+    
+    def _extract_with_selenium(self, post_url: str, add: Callable[[Comment], bool]) -> List[Comment]:
         """
         Extract comments using Selenium WebElement traversal
+        
+        Args:
+            post_url: URL of the loaded post, attached to every comment
+            add: Called with each parsed comment; returns False for duplicates
+            
+        Returns:
+            The comments accepted by add
         """
         comments = []
         
-        # Try different strategies to find comment elements
-        for selector in self.COMMENT_SELECTORS:
-            try:
-                elements = self.get_elements(selector)
-                self.logger.debug(f"Selector '{selector}' found {len(elements)} elements")
-                
-                for element in elements:
-                    comment = self._parse_selenium_element(element)
-                    if comment:
-                        comments.append(comment)
-                        
-                if comments:
-                    self.logger.info(f"Successfully extracted comments with selector: {selector}")
-                    break
-                    
-            except Exception as e:
-                self.logger.debug(f"Selector '{selector}' failed: {e}")
-                continue
+        # Collect the comment elements (first locator that matches) and the
+        # mention fallback text in a single round-trip
+        page_data = self._collect_page_data()
+        mentions = page_data.get('mentions') or []
+        
+        while True:
+            element_data = page_data.get('elements') or []
+            matched_locator = page_data.get('matchedLocator')
+            if matched_locator is None:
+                break
+            self.logger.debug(f"Comment locator {matched_locator} found {len(element_data)} elements")
+            
+            for data in element_data:
+                comment = self._parse_selenium_element(data, post_url)
+                if comment and add(comment):
+                    comments.append(comment)
+            
+            if comments:
+                self.logger.info(
+                    f"Successfully extracted comments with selector: "
+                    f"{self._COMMENT_LOCATORS[matched_locator][0]}"
+                )
+                break
+            
+            # The locator only matched elements that are not comments (e.g.
+            # bare "Reply" / "Like" buttons), so continue with the next ones
+            page_data = self._collect_page_data(matched_locator + 1)
         
         # Try to find comments by looking for mention patterns
         if not comments:
-            comments.extend(self._find_comments_by_mentions())
+            comments.extend(self._find_comments_by_mentions(mentions, post_url, add))
         
         return comments
     
-    def _parse_selenium_element(self, element) -> Optional[Comment]:
+    def _collect_page_data(self, start_index: int = 0) -> Dict[str, Any]:
+        """
+        Run the extraction script over the comment locators and mention XPath
+        
+        Args:
+            start_index: First locator to try; the mention nodes are only
+                collected when starting from the first locator
+        
+        Returns:
+            Dict with 'elements' (collected fields per comment element),
+            'matchedLocator' (index into _COMMENT_LOCATORS or None) and
+            'mentions' (textContent of the mention fallback nodes)
         """
-        Parse a Selenium WebElement to extract comment data
+        page_data = self.execute_script(
+            self._COMMENT_EXTRACTION_SCRIPT,
+            self._COMMENT_LOCATORS,
+            self._USERNAME_CSS_SELECTORS,
+            self.FALLBACK_USERNAME_XPATHS,
+            self._TIMESTAMP_CSS_UNION,
+            self.MAX_COMMENT_ELEMENTS,
+            self.MENTION_XPATH,
+            self.MAX_MENTION_ELEMENTS,
+            start_index,
+        )
+        return page_data or {}
+    
+    def _parse_selenium_element(self, element_data: Dict[str, Any], post_url: str) -> Optional[Comment]:
+        """
+        Parse the fields collected from a comment WebElement
+        
+        Args:
+            element_data: Fields collected by the extraction script
+            post_url: URL of the loaded post
         """
         try:
             # Get text content
-            text_content = element.text.strip()
+            text_content = (element_data.get('text') or '').strip()
             if not text_content or len(text_content) < 2:
                 return None
             
             # Check if this is a text comment (not just images)
-            if not self._is_text_comment(element, text_content):
+            if not self._is_text_comment(element_data, text_content):
                 return None
             
             # Try to find username
-            username = self._extract_username_from_element(element)
+            username = self._extract_username_from_element(element_data)
             if not username:
                 # Try to extract from text content
-                username_match = re.search(r'@(\w+)', text_content)
+                username_match = _mention_search(text_content)
                 if username_match:
                     username = username_match.group(1)
                 else:
@@ -421,116 +907,88 @@ class SeleniumThreadsScraper(SeleniumBaseScraper):
                 return None
             
             # Try to find avatar
-            avatar_url = self._extract_avatar_from_element(element)
+            avatar_url = self._extract_avatar_from_element(element_data)
             
             # Try to extract timestamp
-            timestamp = self._extract_timestamp_from_element(element)
+            timestamp = self._extract_timestamp_from_element(element_data)
             
             # Create comment
             comment = Comment(
-                id=f"selenium_threads_{hash(cleaned_content + username)}",
+                id=self._comment_id("selenium_threads", cleaned_content, username),
                 username=username.lstrip('@'),
                 content=cleaned_content,
                 avatar_url=avatar_url,
                 timestamp=timestamp,
                 platform="threads",
-                post_url=self.driver.current_url
+                post_url=post_url
             )
             
-            comment.extract_mentions()
             return comment
             
         except Exception as e:
             self.logger.debug(f"Failed to parse Selenium element: {e}")
             return None
     
-    def _extract_username_from_element(self, element) -> Optional[str]:
+    def _extract_username_from_element(self, element_data: Dict[str, Any]) -> Optional[str]:
         """
-        Extract username from Selenium element
+        Extract username from collected element data
         """
-        try:
-            # Try to find username links
-            username_links = element.find_elements(By.CSS_SELECTOR, 'a[href*="/@"]')
-            if username_links:
-                href = username_links[0].get_attribute('href')
-                if href:
-                    match = re.search(r'/@([^/?]+)', href)
-                    if match:
-                        return match.group(1)
-            
-            # Try other username selectors
-            for selector in self.USERNAME_SELECTORS:
-                try:
-                    username_elements = element.find_elements(By.CSS_SELECTOR, selector)
-                    if username_elements:
-                        username_text = username_elements[0].text.strip()
-                        if username_text:
-                            return username_text.lstrip('@')
-                except:
-                    continue
-            
-            return None
-            
-        except Exception as e:
-            self.logger.debug(f"Failed to extract username: {e}")
-            return None
+        # Prefer the profile link
+        href = element_data.get('href')
+        if href:
+            match = _HREF_USER_RE.search(href)
+            if match:
+                return match.group(1)
+        
+        # Otherwise use the first non-empty username selector text
+        username_text = element_data.get('usernameText')
+        if username_text:
+            return username_text.lstrip('@')
+        
+        return None
     
-    def _extract_avatar_from_element(self, element) -> Optional[str]:
+    def _extract_avatar_from_element(self, element_data: Dict[str, Any]) -> Optional[str]:
         """
-        Extract avatar URL from Selenium element
+        Extract avatar URL from collected element data
         """
-        try:
-            img_elements = element.find_elements(By.TAG_NAME, 'img')
-            for img in img_elements:
-                src = img.get_attribute('src')
-                if src and ('profile' in src.lower() or 'avatar' in src.lower()):
-                    return src
-            
-            # Return first image if no profile image found
-            if img_elements:
-                return img_elements[0].get_attribute('src')
-            
-            return None
-            
-        except Exception as e:
-            self.logger.debug(f"Failed to extract avatar: {e}")
-            return None
+        # The extraction script already prefers a profile/avatar image and
+        # falls back to the first image
+        return element_data.get('avatar') or None
     
-    def _extract_timestamp_from_element(self, element) -> Optional[datetime]:
+    def _extract_timestamp_from_element(self, element_data: Dict[str, Any]) -> Optional[datetime]:
         """
-        Extract timestamp from Selenium element
+        Extract timestamp from collected element data
         """
         try:
-            # Try different timestamp selectors
-            for selector in self.TIMESTAMP_SELECTORS:
-                try:
-                    timestamp_elements = element.find_elements(By.CSS_SELECTOR, selector)
-                    for ts_elem in timestamp_elements:
-                        # Try datetime attribute first
-                        datetime_attr = ts_elem.get_attribute('datetime')
-                        if datetime_attr:
-                            return self._parse_datetime_string(datetime_attr)
-                        
-                        # Try title attribute (often contains full timestamp)
-                        title_attr = ts_elem.get_attribute('title')
-                        if title_attr:
-                            parsed_time = self._parse_datetime_string(title_attr)
-                            if parsed_time:
-                                return parsed_time
-                        
-                        # Try text content for relative time
-                        text_content = ts_elem.text.strip()
-                        if text_content:
-                            parsed_time = self._parse_relative_time(text_content)
-                            if parsed_time:
-                                return parsed_time
-                                
-                except Exception as e:
-                    self.logger.debug(f"Timestamp selector '{selector}' failed: {e}")
-                    continue
+            # Timestamp candidates are in document order
+            for ts_data in element_data.get('timestamps') or []:
+                # The datetime attribute is usually already parsed by the
+                # browser's Date.parse (epoch milliseconds)
+                date_ms = ts_data.get('dateMs')
+                if date_ms is not None:
+                    return datetime.fromtimestamp(date_ms / 1000)
+                
+                # Try datetime attribute first
+                datetime_attr = ts_data.get('datetime')
+                if datetime_attr:
+                    return self._parse_datetime_string(datetime_attr)
+                
+                # Try title attribute (often contains full timestamp)
+                title_attr = ts_data.get('title')
+                if title_attr:
+                    parsed_time = self._parse_datetime_string(title_attr)
+                    if parsed_time:
+                        return parsed_time
+                
+                # Try text content for relative time
+                text_content = ts_data.get('text')
+                if text_content:
+                    parsed_time = self._parse_relative_time(text_content)
+                    if parsed_time:
+                        return parsed_time
             
             # Fallback: search for time patterns in element text
-            element_text = element.text
+            element_text = element_data.get('text')
             if element_text:
                 return self._extract_time_from_text(element_text)
             
@@ -548,27 +1006,7 @@ class SeleniumThreadsScraper(SeleniumBaseScraper):
             return None
             
         try:
-            # ISO format
-            if 'T' in datetime_str:
-                return datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
-            
-            # Try common formats
-            formats = [
-                '%Y-%m-%d %H:%M:%S',
-                '%Y-%m-%d %H:%M',
-                '%Y-%m-%d',
-                '%m/%d/%Y %H:%M',
-                '%m/%d/%Y',
-                '%d/%m/%Y %H:%M',
-                '%d/%m/%Y',
-            ]
-            
-            for fmt in formats:
-                try:
-                    return datetime.strptime(datetime_str, fmt)
-                except ValueError:
-                    continue
-                    
+            return _parse_datetime_value(datetime_str)
         except Exception as e:
             self.logger.debug(f"Failed to parse datetime string '{datetime_str}': {e}")
             
@@ -580,57 +1018,19 @@ class SeleniumThreadsScraper(SeleniumBaseScraper):
         """
         if not time_text:
             return None
+        
+        # Cheap prefilter: time labels are short and contain a digit
+        time_text = time_text.strip()
+        if (len(time_text) > self._MAX_RELATIVE_TIME_LENGTH
+                or not any(c.isdigit() for c in time_text)):
+            return None
             
         try:
-            now = datetime.now()
-            time_text = time_text.lower().strip()
-            
-            # Extract number and unit
-            import re
-            
-            # English patterns
-            patterns = [
-                (r'(\\d+)\\s*s(?:ec(?:ond)?s?)?', 'seconds'),
-                (r'(\\d+)\\s*m(?:in(?:ute)?s?)?', 'minutes'),
-                (r'(\\d+)\\s*h(?:r|our)?s?', 'hours'),
-                (r'(\\d+)\\s*d(?:ay)?s?', 'days'),
-                (r'(\\d+)\\s*w(?:eek)?s?', 'weeks'),
-                (r'(\\d+)\\s*mo(?:nth)?s?', 'months'),
-                (r'(\\d+)\\s*y(?:ear)?s?', 'years'),
-            ]
-            
-            # Chinese patterns
-            chinese_patterns = [
-                (r'(\\d+)\\s*秒', 'seconds'),
-                (r'(\\d+)\\s*分(?:鐘)?', 'minutes'),
-                (r'(\\d+)\\s*小時', 'hours'),
-                (r'(\\d+)\\s*天', 'days'),
-                (r'(\\d+)\\s*週', 'weeks'),
-                (r'(\\d+)\\s*月', 'months'),
-                (r'(\\d+)\\s*年', 'years'),
-            ]
-            
-            all_patterns = patterns + chinese_patterns
-            
-            for pattern, unit in all_patterns:
-                match = re.search(pattern, time_text)
-                if match:
-                    value = int(match.group(1))
-                    
-                    if unit == 'seconds':
-                        return now - timedelta(seconds=value)
-                    elif unit == 'minutes':
-                        return now - timedelta(minutes=value)
-                    elif unit == 'hours':
-                        return now - timedelta(hours=value)
-                    elif unit == 'days':
-                        return now - timedelta(days=value)
-                    elif unit == 'weeks':
-                        return now - timedelta(weeks=value)
-                    elif unit == 'months':
-                        return now - timedelta(days=value * 30)  # Approximation
-                    elif unit == 'years':
-                        return now - timedelta(days=value * 365)  # Approximation
+            # Extract number and unit in a single scan
+            match = self._RELATIVE_TIME_RE.search(time_text)
+            if match:
+                value = int(match.group(1))
+                return datetime.now() - value * self._RELATIVE_TIME_UNITS[match.lastgroup]
                         
         except Exception as e:
             self.logger.debug(f"Failed to parse relative time '{time_text}': {e}")
@@ -646,7 +1046,7 @@ class SeleniumThreadsScraper(SeleniumBaseScraper):
             
         try:
             # Look for relative time patterns in the entire text
-            lines = text.split('\\n')
+            lines = text.split('\n')
             for line in lines:
                 parsed_time = self._parse_relative_time(line.strip())
                 if parsed_time:
@@ -657,30 +1057,33 @@ class SeleniumThreadsScraper(SeleniumBaseScraper):
             
         return None
     
-    def _is_text_comment(self, element, text_content: str) -> bool:
+    def _is_text_comment(self, element_data: Dict[str, Any], text_content: str) -> bool:
         """
         Check if this element represents a text comment (not just images)
+        
+        Args:
+            element_data: Extracted element data with mediaCount / nonEmptyTextCount
+            text_content: Text content of the element
         """
         try:
             # If there's substantial text content, it's likely a text comment
             if len(text_content.strip()) > 10:
                 return True
             
-            # Check if the element contains media without meaningful text
-            media_elements = element.find_elements(By.CSS_SELECTOR, 'img, video, svg')
-            text_elements = element.find_elements(By.CSS_SELECTOR, 'span, p, div')
+            # Media and text-node counts are computed in the browser by the
+            # extraction script
+            media_count = element_data.get('mediaCount', 0)
             
             # If there are media elements but very little text, skip
-            if media_elements and len(text_content.strip()) < 5:
+            if media_count and len(text_content.strip()) < 5:
                 return False
             
             # Check for image-only patterns
-            if (len(media_elements) > 0 and 
-                len([elem for elem in text_elements if elem.text.strip()]) == 0):
+            if media_count > 0 and element_data.get('nonEmptyTextCount', 0) == 0:
                 return False
             
             # Must contain some actual text (not just emojis or symbols)
-            text_chars = re.sub(r'[^\w\s]', '', text_content)
+            text_chars = self._NONWORD_RE.sub('', text_content)
             if len(text_chars.strip()) < 2:
                 return False
             
@@ -699,22 +1102,15 @@ class SeleniumThreadsScraper(SeleniumBaseScraper):
             return ""
         
         try:
-            # Remove extra whitespace and newlines
-            cleaned = re.sub(r'\\s+', ' ', content.strip())
+            # Remove lines that only hold UI labels, while the line breaks
+            # are still there to tell them apart from the comment text
+            cleaned = self._UI_LINE_RE.sub('', content)
             
-            # Remove common UI elements that appear in scraped text
-            ui_patterns = [
-                r'\\b(liked|like|reply|share|more|關於|回覆|分享|更多)\\b',
-                r'\\b\\d+\\s*(likes?|replies?|個讚|則回覆)\\b',
-                r'\\b(view|查看)\\s*(profile|個人檔案)\\b',
-                r'\\b(follow|追蹤|following|已追蹤)\\b',
-            ]
-            
-            for pattern in ui_patterns:
-                cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
+            # Remove extra whitespace and newlines
+            cleaned = self._WS_RE.sub(' ', cleaned.strip())
             
-            # Remove extra spaces created by pattern removal
-            cleaned = re.sub(r'\\s+', ' ', cleaned.strip())
+            # Remove a trailing like/reply counter and the labels after it
+            cleaned = self._UI_TRAILING_RE.sub('', cleaned)
             
             return cleaned
             
@@ -722,46 +1118,38 @@ class SeleniumThreadsScraper(SeleniumBaseScraper):
             self.logger.debug(f"Error cleaning comment content: {e}")
             return content
     
-    def _find_comments_by_mentions(self) -> List[Comment]:
+    def _find_comments_by_mentions(
+        self, texts: List[str], post_url: str, add: Callable[[Comment], bool]
+    ) -> List[Comment]:
         """
         Find comments by looking for @ mentions
+        
+        Args:
+            texts: textContent of the elements matched by MENTION_XPATH,
+                collected by the extraction script
+            post_url: URL of the loaded post
+            add: Called with each comment; returns False for duplicates
         """
         comments = []
         
         try:
-            # Use JavaScript to find elements containing @ symbols
-            js_script = """
-            var elements = document.querySelectorAll('*');
-            var mentionElements = [];
-            for (var i = 0; i < elements.length; i++) {
-                if (elements[i].textContent && elements[i].textContent.includes('@')) {
-                    mentionElements.push(elements[i]);
-                }
-            }
-            return mentionElements.slice(0, 50); // Limit to first 50
-            """
-            
-            mention_elements = self.execute_script(js_script)
-            if not mention_elements:
-                return comments
-            
-            for element in mention_elements[:20]:  # Process first 20
+            for raw_text in texts:
                 try:
-                    text_content = element.text.strip()
+                    text_content = self._WS_RE.sub(' ', raw_text).strip()
                     if text_content and '@' in text_content and len(text_content) > 5:
                         # Extract potential username
-                        username_match = re.search(r'@(\w+)', text_content)
+                        username_match = _mention_search(text_content)
                         username = username_match.group(1) if username_match else "unknown_user"
                         
                         comment = Comment(
-                            id=f"selenium_mention_{hash(text_content + username)}",
+                            id=self._comment_id("selenium_mention", text_content, username),
                             username=username,
                             content=text_content,
                             platform="threads",
-                            post_url=self.driver.current_url
+                            post_url=post_url
                         )
-                        comment.extract_mentions()
-                        comments.append(comment)
+                        if add(comment):
+                            comments.append(comment)
                 except:
                     continue
             
@@ -770,9 +1158,14 @@ class SeleniumThreadsScraper(SeleniumBaseScraper):
         
         return comments
     
-    def _extract_with_beautifulsoup(self, soup, url: str) -> List[Comment]:
+    def _extract_with_beautifulsoup(self, soup, url: str, add: Callable[[Comment], bool]) -> List[Comment]:
         """
         Extract comments using BeautifulSoup on current page source
+        
+        Args:
+            soup: Parsed page source
+            url: Post URL
+            add: Called with each comment; returns False for duplicates
         """
         comments = []
         
@@ -782,9 +1175,18 @@ class SeleniumThreadsScraper(SeleniumBaseScraper):
         # Look for text patterns that might indicate comments
         text_content = soup.get_text()
         
-        # Pattern for @username mentions followed by text
-        mention_pattern = r'@(\\w+)\\s+([^@]+?)(?=@|\\n|$)'
-        matches = re.findall(mention_pattern, text_content, re.MULTILINE)
+        # Mention-free pages cannot yield anything; skip the regex scan
+        if '@' not in text_content:
+            return comments
+        
+        # @username mentions followed by text: split on '@' in one pass and
+        # only match each short fragment's head, instead of scanning the whole
+        # page text with a regex
+        matches = [
+            match.groups()
+            for match in map(_mention_body_match, text_content.split('@')[1:])
+            if match
+        ]
         
         for i, (username, content) in enumerate(matches):
             if len(content.strip()) > 10:  # Filter out very short content
@@ -795,44 +1197,23 @@ class SeleniumThreadsScraper(SeleniumBaseScraper):
                     platform="threads",
                     post_url=url
                 )
-                comment.extract_mentions()
-                comments.append(comment)
+                if add(comment):
+                    comments.append(comment)
         
         return comments
     
-    def _extract_with_javascript(self, url: str) -> List[Comment]:
+    def _extract_with_javascript(self, url: str, add: Callable[[Comment], bool]) -> List[Comment]:
         """
         Extract comments using JavaScript execution
+        
+        Args:
+            url: Post URL
+            add: Called with each comment; returns False for duplicates
         """
         comments = []
         
         try:
-            # JavaScript to extract comment-like structures
-            js_script = """
-            var comments = [];
-            var allElements = document.querySelectorAll('div, article, section');
-            
-            for (var i = 0; i < allElements.length; i++) {
-                var element = allElements[i];
-                var text = element.textContent || '';
-                
-                // Look for elements that might be comments
-                if (text.length > 10 && text.length < 1000 && text.includes('@')) {
-                    var usernameMatch = text.match(/@(\\w+)/);
-                    if (usernameMatch) {
-                        comments.push({
-                            username: usernameMatch[1],
-                            content: text.trim(),
-                            hasAvatar: element.querySelector('img') !== null
-                        });
-                    }
-                }
-            }
-            
-            return comments.slice(0, 20); // Limit results
-            """
-            
-            js_comments = self.execute_script(js_script)
+            js_comments = self.execute_script(self._COMMENT_SCAN_SCRIPT, 20)
             
             if js_comments:
                 for i, js_comment in enumerate(js_comments):
@@ -843,29 +1224,14 @@ class SeleniumThreadsScraper(SeleniumBaseScraper):
                         platform="threads",
                         post_url=url
                     )
-                    comment.extract_mentions()
-                    comments.append(comment)
+                    if add(comment):
+                        comments.append(comment)
             
         except Exception as e:
             self.logger.debug(f"JavaScript extraction failed: {e}")
         
         return comments
     
-    def _deduplicate_comments(self, comments: List[Comment]) -> List[Comment]:
-        """
-        Remove duplicate comments based on content and username
-        """
-        seen = set()
-        unique_comments = []
-        
-        for comment in comments:
-            key = (comment.username.lower(), comment.content.lower().strip())
-            if key not in seen:
-                seen.add(key)
-                unique_comments.append(comment)
-        
-        return unique_comments
-    
     def cleanup(self):
         """
         Clean up resources including authentication state
@@ -3,20 +3,64 @@ Threads scraper implementation
 """
 import re
 import json
-from typing import List, Optional, Dict, Any
+from collections import deque
+from typing import List, Optional, Dict, Any, Callable
 from urllib.parse import urlparse, parse_qs
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .base_scraper import BaseScraper, ScrapingError
 from ...models import Comment
 
 
+# Patterns used while parsing comment elements, compiled once at import
+_RE_USER_HREF = re.compile(r'/@\w+')
+_RE_USER_AUTHOR = re.compile(r'user|author')
+_RE_USER_AUTHOR_NAME = re.compile(r'user|author|name')
+
+# 'username comment text' at the start of a fragment of flattened page text
+# that followed an '@'; the text runs to the end of the line (fragments are
+# split on '@', so they never contain one)
+_RE_MENTION_BODY = re.compile(r'(\w+)\s+([^\n]+)')
+_mention_body_match = _RE_MENTION_BODY.match
+
+# Parser for embedded JSON: orjson is several times faster on multi-MB
+# payloads when installed; both raise ValueError subclasses on bad input
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
 class ThreadsScraper(BaseScraper):
     """
     Scraper for Threads posts
     """
     
-    THREADS_DOMAINS = ['threads.com', 'www.threads.com', 'threads.net', 'www.threads.net']
+    THREADS_DOMAINS = frozenset(['threads.com', 'www.threads.com', 'threads.net', 'www.threads.net'])
+    
+    # Keys that mark a JSON object as a comment: one text key and one user key
+    COMMENT_TEXT_KEYS = ['text', 'content', 'message', 'body']
+    COMMENT_USER_KEYS = ['user', 'author', 'username', 'owner']
+    
+    # The same keys as they appear in raw JSON, used to skip script blobs
+    # that cannot contain a comment object before parsing them
+    _JSON_TEXT_KEY_MARKERS = tuple(f'"{key}"' for key in COMMENT_TEXT_KEYS)
+    _JSON_USER_KEY_MARKERS = tuple(f'"{key}"' for key in COMMENT_USER_KEYS)
+    
+    # Common HTML patterns for comments
+    COMMENT_SELECTORS = [
+        '[data-testid*="comment"]',
+        '[class*="comment"]',
+        '[class*="reply"]',
+        '.x1i10hfl',  # Common Threads class pattern
+        '[role="article"]'
+    ]
+    
+    # All comment selectors as one selector group, so the DOM is walked once
+    COMMENT_SELECTORS_JOINED = ', '.join(COMMENT_SELECTORS)
     
     def validate_url(self, url: str) -> bool:
         """
@@ -29,10 +73,15 @@ class ThreadsScraper(BaseScraper):
             True if URL is valid Threads URL
         """
         try:
-            parsed = urlparse(url)
+            # Split 'scheme://host/path?query#fragment' by hand; this runs on
+            # every validation request, and urlparse does far more work
+            scheme, _, rest = url.partition('://')
+            host, _, path = rest.partition('/')
+            path = path.partition('#')[0].partition('?')[0]
             return (
-                parsed.netloc.lower() in self.THREADS_DOMAINS and
-                '/post/' in parsed.path
+                scheme.isalpha() and
+                host.lower() in self.THREADS_DOMAINS and
+                '/post/' in '/' + path
             )
         except Exception:
             return False
@@ -77,23 +126,38 @@ class ThreadsScraper(BaseScraper):
             response = self._make_request(url)
             soup = self._parse_html(response.text)
             
-            # Extract comments using multiple strategies
-            comments = []
+            # Extract comments using multiple strategies. Each strategy
+            # hands its comments to add(), which keeps only the first comment
+            # seen for each (username, content) pair. The strategies are
+            # pure-Python walks of the same tree and hold the GIL, so they run
+            # in priority order and later ones only run when earlier ones find
+            # nothing; running them on worker threads measured slower
+            unique: Dict[bytes, Comment] = {}
+            
+            def add(comment: Comment) -> bool:
+                key = comment.dedup_key
+                if key in unique:
+                    return False
+                unique[key] = comment
+                return True
             
             # Strategy 1: Look for JSON data in script tags
-            json_comments = self._extract_from_json_data(soup, url)
-            if json_comments:
-                comments.extend(json_comments)
+            self._extract_from_json_data(soup, url, add)
             
             # Strategy 2: Parse HTML structure
-            if not comments:
-                html_comments = self._extract_from_html_structure(soup, url)
-                comments.extend(html_comments)
+            if not unique:
+                self._extract_from_html_structure(soup, url, add)
             
             # Strategy 3: Fallback - look for basic patterns
-            if not comments:
-                pattern_comments = self._extract_from_patterns(soup, url)
-                comments.extend(pattern_comments)
+            if not unique:
+                self._extract_from_patterns(soup, url, add)
+            
+            comments = list(unique.values())
+            
+            # Mentions are only needed for comments that survived
+            # de-duplication
+            for comment in comments:
+                comment.extract_mentions()
             
             self.logger.info(f"Extracted {len(comments)} comments from Threads")
             return comments
@@ -101,7 +165,7 @@ class ThreadsScraper(BaseScraper):
         except Exception as e:
             raise ScrapingError(f"Failed to scrape Threads comments: {e}")
     
-    def _extract_from_json_data(self, soup, url: str) -> List[Comment]:
+    def _extract_from_json_data(self, soup, url: str, add: Callable[[Comment], bool]) -> List[Comment]:
         """
         Extract comments from JSON data in script tags
         """
@@ -109,36 +173,54 @@ class ThreadsScraper(BaseScraper):
         script_tags = soup.find_all('script', type='application/json')
         
         for script in script_tags:
+            raw = script.string
+            if not raw:
+                continue
+            
+            # Embedded JSON blobs can be several MB; only parse the ones that
+            # mention both a text key and a user key somewhere
+            if not (any(marker in raw for marker in self._JSON_TEXT_KEY_MARKERS) and
+                    any(marker in raw for marker in self._JSON_USER_KEY_MARKERS)):
+                continue
+            
             try:
-                data = json.loads(script.string)
+                data = _json_loads(raw)
                 # Look for comment-like structures in the JSON
-                comments.extend(self._parse_json_for_comments(data, url))
-            except (json.JSONDecodeError, TypeError):
+                comments.extend(
+                    comment for comment in self._parse_json_for_comments(data, url)
+                    if add(comment)
+                )
+            except (ValueError, TypeError):
                 continue
         
         return comments
     
-    def _parse_json_for_comments(self, data: Any, url: str, path: str = "") -> List[Comment]:
+    def _parse_json_for_comments(self, data: Any, url: str) -> List[Comment]:
         """
-        Recursively parse JSON data for comment structures
+        Walk JSON data depth-first for comment structures
+        
+        Uses an explicit stack instead of recursion, so deeply nested
+        payloads cannot hit the recursion limit. Children are pushed in
+        reverse so comments come out in document order. Decoded JSON is
+        always a tree, so no container can be reached twice.
         """
         comments = []
+        stack = deque([data])
         
-        if isinstance(data, dict):
-            # Look for comment-like objects
-            if self._is_comment_object(data):
-                comment = self._create_comment_from_json(data, url)
-                if comment:
-                    comments.append(comment)
+        while stack:
+            node = stack.pop()
             
-            # Recursively search in nested objects
-            for key, value in data.items():
-                comments.extend(self._parse_json_for_comments(value, url, f"{path}.{key}"))
-        
-        elif isinstance(data, list):
-            # Search in array items
-            for i, item in enumerate(data):
-                comments.extend(self._parse_json_for_comments(item, url, f"{path}[{i}]"))
+            if isinstance(node, dict):
+                # Look for comment-like objects
+                if self._is_comment_object(node):
+                    comment = self._create_comment_from_json(node, url)
+                    if comment:
+                        comments.append(comment)
+                
+                stack.extend(reversed(list(node.values())))
+            
+            elif isinstance(node, list):
+                stack.extend(reversed(node))
         
         return comments
     
@@ -150,11 +232,8 @@ class ThreadsScraper(BaseScraper):
             return False
         
         # Look for common comment properties
-        comment_indicators = ['text', 'content', 'message', 'body']
-        user_indicators = ['user', 'author', 'username', 'owner']
-        
-        has_text = any(key in obj for key in comment_indicators)
-        has_user = any(key in obj for key in user_indicators)
+        has_text = any(key in obj for key in self.COMMENT_TEXT_KEYS)
+        has_user = any(key in obj for key in self.COMMENT_USER_KEYS)
         
         return has_text and has_user
     
@@ -195,7 +274,7 @@ class ThreadsScraper(BaseScraper):
             
             # Create comment
             comment = Comment(
-                id=data.get('id', f"threads_{hash(text + username)}"),
+                id=data.get('id') or self._comment_id("threads", text, username),
                 username=username.lstrip('@'),
                 content=text,
                 avatar_url=avatar_url,
@@ -205,59 +284,43 @@ class ThreadsScraper(BaseScraper):
                 replies_count=data.get('reply_count', 0)
             )
             
-            # Extract mentions
-            comment.extract_mentions()
-            
             return comment
             
         except Exception as e:
             self.logger.warning(f"Failed to create comment from JSON: {e}")
             return None
     
-    def _extract_from_html_structure(self, soup, url: str) -> List[Comment]:
+    def _extract_from_html_structure(self, soup, url: str, add: Callable[[Comment], bool]) -> List[Comment]:
         """
         Extract comments from HTML structure
         """
         comments = []
         
-        # Look for common HTML patterns for comments
-        comment_selectors = [
-            '[data-testid*="comment"]',
-            '[class*="comment"]',
-            '[class*="reply"]',
-            '.x1i10hfl',  # Common Threads class pattern
-            '[role="article"]'
-        ]
-        
-        for selector in comment_selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                comment = self._parse_html_comment(element, url)
-                if comment:
-                    comments.append(comment)
+        # One traversal for every selector; each matching element is
+        # returned once, in document order
+        for element in soup.select(self.COMMENT_SELECTORS_JOINED):
+            comment = self._parse_html_comment(element, url)
+            if comment and add(comment):
+                comments.append(comment)
         
-        return self._deduplicate_comments(comments)
+        return comments
     
     def _parse_html_comment(self, element, url: str) -> Optional[Comment]:
         """
         Parse individual HTML comment element
         """
         try:
-            # Try to extract text content
-            text_element = element.find(text=True, recursive=True)
-            if not text_element:
-                return None
-            
-            # Get all text content
-            text_content = ' '.join(element.stripped_strings)
-            if not text_content or len(text_content) < 2:
+            # Get all text content in one walk; an element without any text
+            # comes back as an empty string
+            text_content = element.get_text(' ', strip=True)
+            if len(text_content) < 2:
                 return None
             
             # Try to find username (often in links or specific attributes)
             username_element = (
-                element.find('a', href=re.compile(r'/@\w+')) or
-                element.find(attrs={'data-testid': re.compile(r'user|author')}) or
-                element.find(class_=re.compile(r'user|author|name'))
+                element.find('a', href=_RE_USER_HREF) or
+                element.find(attrs={'data-testid': _RE_USER_AUTHOR}) or
+                element.find(class_=_RE_USER_AUTHOR_NAME)
             )
             
             username = "unknown_user"
@@ -269,7 +332,7 @@ class ThreadsScraper(BaseScraper):
             avatar_url = avatar_element.get('src') if avatar_element else None
             
             comment = Comment(
-                id=f"threads_html_{hash(text_content + username)}",
+                id=self._comment_id("threads_html", text_content, username),
                 username=username,
                 content=text_content,
                 avatar_url=avatar_url,
@@ -277,14 +340,13 @@ class ThreadsScraper(BaseScraper):
                 post_url=url
             )
             
-            comment.extract_mentions()
             return comment
             
         except Exception as e:
             self.logger.debug(f"Failed to parse HTML comment: {e}")
             return None
     
-    def _extract_from_patterns(self, soup, url: str) -> List[Comment]:
+    def _extract_from_patterns(self, soup, url: str, add: Callable[[Comment], bool]) -> List[Comment]:
         """
         Extract comments using text patterns (fallback method)
         """
@@ -293,9 +355,14 @@ class ThreadsScraper(BaseScraper):
         # Look for text patterns that might indicate comments
         text_content = soup.get_text()
         
-        # Pattern for @username mentions followed by text
-        mention_pattern = r'@(\w+)\s+([^@]+?)(?=@|\n|$)'
-        matches = re.findall(mention_pattern, text_content, re.MULTILINE)
+        # @username mentions followed by text: split on '@' in one linear
+        # pass and only match each fragment's head, so the lazy quantifier and
+        # lookahead never scan across the whole page text
+        matches = [
+            match.groups()
+            for match in map(_mention_body_match, text_content.split('@')[1:])
+            if match
+        ]
         
         for i, (username, content) in enumerate(matches):
             if len(content.strip()) > 10:  # Filter out very short content
@@ -306,22 +373,7 @@ class ThreadsScraper(BaseScraper):
                     platform="threads",
                     post_url=url
                 )
-                comment.extract_mentions()
-                comments.append(comment)
+                if add(comment):
+                    comments.append(comment)
         
         return comments
-    
-    def _deduplicate_comments(self, comments: List[Comment]) -> List[Comment]:
-        """
-        Remove duplicate comments based on content and username
-        """
-        seen = set()
-        unique_comments = []
-        
-        for comment in comments:
-            key = (comment.username.lower(), comment.content.lower().strip())
-            if key not in seen:
-                seen.add(key)
-                unique_comments.append(comment)
-        
-        return unique_comments
\ No newline at end of file
@@ -2,21 +2,50 @@
 Excel export functionality for lottery results
 """
 import os
+import importlib.util
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Dict, Any, TYPE_CHECKING
 import logging
 
-try:
+# openpyxl takes a noticeable fraction of a second to import, so only check
+# that it is installed here and import it on the first Excel export
+OPENPYXL_AVAILABLE = importlib.util.find_spec('openpyxl') is not None
+
+if TYPE_CHECKING:
     from openpyxl import Workbook
-    from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-    from openpyxl.utils import get_column_letter
-    OPENPYXL_AVAILABLE = True
-except ImportError:
-    OPENPYXL_AVAILABLE = False
+
+# Shared style objects, built by _load_styles() on first use
+_STYLES: Dict[str, Any] = {}
 
 from ..models import LotteryResult, Comment
 
 
+def _load_styles() -> Dict[str, Any]:
+    """
+    Import openpyxl's style classes and build the shared style objects
+    
+    Style objects are immutable once assigned, so every export shares one
+    instance of each; they are built on the first call and cached.
+    
+    Returns:
+        Dictionary of style objects keyed by role
+    """
+    if not _STYLES:
+        from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+        
+        thin_side = Side(style='thin')
+        _STYLES.update({
+            'summary_label_font': Font(bold=True, size=12),
+            'summary_section_fill': PatternFill(start_color="E6E6FA", end_color="E6E6FA", fill_type="solid"),
+            'header_font': Font(bold=True, color="FFFFFF"),
+            'header_fill': PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid"),
+            'header_align': Alignment(horizontal="center", vertical="center"),
+            'border': Border(left=thin_side, right=thin_side, top=thin_side, bottom=thin_side),
+            'data_align': Alignment(wrap_text=True, vertical="top"),
+        })
+    return _STYLES
+
+
 class ExcelExporter:
     """
     Excel exporter for lottery results
@@ -77,25 +106,25 @@ class ExcelExporter:
         
         self.logger.info(f"Exporting lottery result to {filepath}")
         
-        # Create workbook
-        wb = Workbook()
+        from openpyxl import Workbook
+        
+        # Create a write-only workbook: rows are streamed out as they are
+        # appended instead of being held as a grid of cell objects. It has
+        # no default sheet to remove.
+        wb = Workbook(write_only=True)
         
         # Create worksheets
         self._create_summary_sheet(wb, result)
         self._create_winners_sheet(wb, result)
         self._create_all_participants_sheet(wb, result)
         
-        # Remove default sheet
-        if 'Sheet' in wb.sheetnames:
-            wb.remove(wb['Sheet'])
-        
         # Save workbook
         wb.save(filepath)
         
         self.logger.info(f"Excel file exported successfully: {filepath}")
         return filepath
     
-    def _create_summary_sheet(self, wb: Workbook, result: LotteryResult):
+    def _create_summary_sheet(self, wb: 'Workbook', result: LotteryResult):
         """Create summary worksheet"""
         ws = wb.create_sheet("摘要資訊")
         
@@ -125,126 +154,143 @@ class ExcelExporter:
             ("實際中獎人數", str(len(result.winners))),
         ])
         
-        # Write headers
-        for i, (label, value) in enumerate(headers, 1):
-            ws[f"A{i}"] = label
-            ws[f"B{i}"] = value
-        
-        # Style the worksheet
-        self._style_summary_sheet(ws)
+        # Style and write the worksheet
+        self._style_summary_sheet(ws, headers)
     
-    def _create_winners_sheet(self, wb: Workbook, result: LotteryResult):
+    def _create_winners_sheet(self, wb: 'Workbook', result: LotteryResult):
         """Create winners worksheet"""
         ws = wb.create_sheet("中獎名單")
         
         # Headers
         headers = ["排名", "用戶名", "留言內容", "標註數量", "按讚數", "頭像網址"]
-        for col, header in enumerate(headers, 1):
-            ws.cell(row=1, column=col, value=header)
         
         # Winners data
-        for i, winner in enumerate(result.winners, 1):
-            row = i + 1
-            ws.cell(row=row, column=1, value=i)
-            ws.cell(row=row, column=2, value=winner.username)
-            ws.cell(row=row, column=3, value=winner.content)
-            ws.cell(row=row, column=4, value=winner.mention_count())
-            ws.cell(row=row, column=5, value=winner.likes_count)
-            ws.cell(row=row, column=6, value=winner.avatar_url or "")
-        
-        # Style the worksheet
-        self._style_data_sheet(ws, len(headers))
+        rows = [
+            [
+                i,
+                winner.username,
+                winner.content,
+                winner.mention_count(),
+                winner.likes_count,
+                winner.avatar_url or ""
+            ]
+            for i, winner in enumerate(result.winners, 1)
+        ]
+        
+        # Style and write the worksheet
+        self._style_data_sheet(ws, headers, rows)
     
-    def _create_all_participants_sheet(self, wb: Workbook, result: LotteryResult):
+    def _create_all_participants_sheet(self, wb: 'Workbook', result: LotteryResult):
         """Create all participants worksheet"""
         ws = wb.create_sheet("所有參與者")
         
         # Headers
         headers = ["用戶名", "留言內容", "標註數量", "符合條件", "按讚數", "平台"]
-        for col, header in enumerate(headers, 1):
-            ws.cell(row=1, column=col, value=header)
+        
+        # Eligible participants are the same objects as in all_participants,
+        # so look them up by identity instead of scanning the list per row
+        eligible_ids = {id(participant) for participant in result.eligible_participants}
         
         # Participants data
-        for i, participant in enumerate(result.all_participants, 1):
-            row = i + 1
-            is_eligible = participant in result.eligible_participants
-            
-            ws.cell(row=row, column=1, value=participant.username)
-            ws.cell(row=row, column=2, value=participant.content)
-            ws.cell(row=row, column=3, value=participant.mention_count())
-            ws.cell(row=row, column=4, value="是" if is_eligible else "否")
-            ws.cell(row=row, column=5, value=participant.likes_count)
-            ws.cell(row=row, column=6, value=participant.platform.upper())
-        
-        # Style the worksheet
-        self._style_data_sheet(ws, len(headers))
+        rows = [
+            [
+                participant.username,
+                participant.content,
+                participant.mention_count(),
+                "是" if id(participant) in eligible_ids else "否",
+                participant.likes_count,
+                participant.platform.upper()
+            ]
+            for participant in result.all_participants
+        ]
+        
+        # Style and write the worksheet
+        self._style_data_sheet(ws, headers, rows)
     
-    def _style_summary_sheet(self, ws):
-        """Apply styles to summary sheet"""
-        # Header style
-        header_font = Font(bold=True, size=12)
-        header_fill = PatternFill(start_color="E6E6FA", end_color="E6E6FA", fill_type="solid")
-        
-        # Apply styles
-        for row in ws.iter_rows():
-            for cell in row:
-                if cell.column == 1 and cell.value:  # Labels column
-                    cell.font = header_font
-                    if "資訊" in str(cell.value):
-                        cell.fill = header_fill
-                
-                # Auto-adjust column width
-                if cell.value:
-                    column_letter = get_column_letter(cell.column)
+    def _style_summary_sheet(self, ws, rows: List[tuple]):
+        """
+        Apply styles to summary sheet while writing its (label, value) rows
+        
+        Write-only sheets stream rows out as they are appended, so column
+        widths are set first and label cells are styled as they are written.
+        """
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.utils import get_column_letter
+        
+        styles = _load_styles()
+        
+        # Auto-adjust column width
+        for row in rows:
+            for col, value in enumerate(row, 1):
+                if value:
+                    column_letter = get_column_letter(col)
                     current_width = ws.column_dimensions[column_letter].width or 10
-                    new_width = len(str(cell.value)) + 2
+                    new_width = len(str(value)) + 2
                     ws.column_dimensions[column_letter].width = max(current_width, new_width)
+        
+        # Write rows, styling the labels column
+        for label, value in rows:
+            label_cell = WriteOnlyCell(ws, value=label)
+            if label:
+                label_cell.font = styles['summary_label_font']
+                if "資訊" in label:
+                    label_cell.fill = styles['summary_section_fill']
+            ws.append([label_cell, value])
     
-    def _style_data_sheet(self, ws, num_columns: int):
-        """Apply styles to data sheets"""
-        # Header style
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        header_alignment = Alignment(horizontal="center", vertical="center")
-        
-        # Border style
-        thin_border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-        
-        # Apply header styles
-        for col in range(1, num_columns + 1):
-            cell = ws.cell(row=1, column=col)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_alignment
-            cell.border = thin_border
-        
-        # Apply data styles and borders
-        for row in ws.iter_rows(min_row=2):
-            for cell in row:
-                cell.border = thin_border
-                cell.alignment = Alignment(wrap_text=True, vertical="top")
-        
-        # Auto-adjust column widths
-        for col in range(1, num_columns + 1):
-            column_letter = get_column_letter(col)
-            max_length = 0
-            
-            for row in ws.iter_rows(min_col=col, max_col=col):
-                for cell in row:
-                    if cell.value:
-                        max_length = max(max_length, len(str(cell.value)))
-            
-            # Set reasonable width limits
-            adjusted_width = min(max(max_length + 2, 10), 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+    def _style_data_sheet(self, ws, headers: List[str], rows: List[list]):
+        """
+        Apply styles to data sheets while writing the header and data rows
+        
+        Write-only sheets stream rows out as they are appended, so column
+        widths and the frozen header row are set first and each cell is
+        styled as it is written.
+        """
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.utils import get_column_letter
+        
+        styles = _load_styles()
+        
+        # Auto-adjust column widths: one pass over the rows keeps a running
+        # maximum per column instead of re-reading every row per column
+        max_lengths = [len(header) for header in headers]
+        for row in rows:
+            for col, value in enumerate(row):
+                if value:
+                    length = len(str(value))
+                    if length > max_lengths[col]:
+                        max_lengths[col] = length
+        
+        # Set reasonable width limits
+        for col, max_length in enumerate(max_lengths, 1):
+            ws.column_dimensions[get_column_letter(col)].width = min(max(max_length + 2, 10), 50)
         
         # Freeze header row
         ws.freeze_panes = "A2"
+        
+        # Write header row
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.font = styles['header_font']
+            cell.fill = styles['header_fill']
+            cell.alignment = styles['header_align']
+            cell.border = styles['border']
+            header_cells.append(cell)
+        ws.append(header_cells)
+        
+        # Write data rows with borders, styling each cell as it is written.
+        # Every cell gets the same shared style objects, which the workbook
+        # stores once in its style tables
+        border = styles['border']
+        data_align = styles['data_align']
+        for row in rows:
+            data_cells = []
+            for value in row:
+                cell = WriteOnlyCell(ws, value=value)
+                cell.border = border
+                cell.alignment = data_align
+                data_cells.append(cell)
+            ws.append(data_cells)
     
     def _export_to_csv(self, result: LotteryResult, filename: Optional[str] = None) -> str:
         """
@@ -293,14 +339,17 @@ class ExcelExporter:
             writer.writerow(["中獎名單"])
             writer.writerow(["排名", "用戶名", "留言內容", "標註數量", "按讚數"])
             
-            for i, winner in enumerate(result.winners, 1):
-                writer.writerow([
+            # Stream every winner row through a single writerows() call
+            writer.writerows(
+                (
                     i,
                     winner.username,
                     winner.content,
                     winner.mention_count(),
                     winner.likes_count
-                ])
+                )
+                for i, winner in enumerate(result.winners, 1)
+            )
         
         self.logger.info(f"CSV file exported successfully: {filepath}")
         return filepath
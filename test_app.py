@@ -2,14 +2,18 @@
 """
 簡單的測試腳本，驗證應用程式基本功能
 """
+import asyncio
 import requests
 import json
 import time
 
+# 所有請求共用一個 Session，重複使用同一條 keep-alive 連線
+SESSION = requests.Session()
+
 def test_app_running():
     """測試應用程式是否正在運行"""
     try:
-        response = requests.get('http://localhost:5001/', timeout=5)
+        response = SESSION.get('http://localhost:5001/', timeout=5)
         print(f"✅ 應用程式正在運行 - 狀態碼: {response.status_code}")
         return True
     except requests.exceptions.RequestException as e:
@@ -19,7 +23,7 @@ def test_app_running():
 def test_health_check():
     """測試健康檢查端點"""
     try:
-        response = requests.get('http://localhost:5001/api/health', timeout=5)
+        response = SESSION.get('http://localhost:5001/api/health', timeout=5)
         if response.status_code == 200:
             data = response.json()
             print(f"✅ 健康檢查通過")
@@ -32,6 +36,21 @@ def test_health_check():
         print(f"❌ 健康檢查錯誤: {e}")
         return False
 
+def _validate_url(url):
+    """送出單一網址驗證請求"""
+    return SESSION.post(
+        'http://localhost:5001/api/validate-url',
+        json={'url': url},
+        timeout=5
+    )
+
+async def _validate_urls(urls):
+    """同時送出所有網址驗證請求，結果順序與 urls 相同"""
+    return await asyncio.gather(
+        *(asyncio.to_thread(_validate_url, url) for url in urls),
+        return_exceptions=True
+    )
+
 def test_url_validation():
     """測試網址驗證功能"""
     test_urls = [
@@ -41,33 +60,31 @@ def test_url_validation():
         ("invalid-url", False)
     ]
     
-    for url, expected in test_urls:
-        try:
-            response = requests.post(
-                'http://localhost:5001/api/validate-url',
-                json={'url': url},
-                timeout=5
-            )
+    responses = asyncio.run(_validate_urls([url for url, _ in test_urls]))
+    
+    for (url, expected), response in zip(test_urls, responses):
+        if isinstance(response, requests.exceptions.RequestException):
+            print(f"❌ 網址驗證錯誤: {response}")
+            continue
+        if isinstance(response, BaseException):
+            raise response
+        
+        if response.status_code == 200:
+            data = response.json()
+            is_valid = data.get('valid', False)
             
-            if response.status_code == 200:
-                data = response.json()
-                is_valid = data.get('valid', False)
-                
-                if is_valid == expected:
-                    print(f"✅ 網址驗證正確: {url} -> {is_valid}")
-                else:
-                    print(f"❌ 網址驗證失敗: {url} -> 預期 {expected}, 得到 {is_valid}")
+            if is_valid == expected:
+                print(f"✅ 網址驗證正確: {url} -> {is_valid}")
             else:
-                print(f"❌ 網址驗證請求失敗: {response.status_code}")
-                
-        except requests.exceptions.RequestException as e:
-            print(f"❌ 網址驗證錯誤: {e}")
+                print(f"❌ 網址驗證失敗: {url} -> 預期 {expected}, 得到 {is_valid}")
+        else:
+            print(f"❌ 網址驗證請求失敗: {response.status_code}")
 
 def test_error_handling():
     """測試錯誤處理"""
     try:
         # 測試無效的抽獎請求
-        response = requests.post(
+        response = SESSION.post(
             'http://localhost:5001/lottery',
             json={'url': '', 'mode': '1', 'winner_count': 0},
             timeout=5
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+留言解析測試：驗證 Selenium 爬蟲清理留言文字與解析相對時間的規則，不需要啟動瀏覽器
+"""
+import logging
+import os
+import sys
+from datetime import datetime, timedelta
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.main.python.services.scrapers.selenium_threads_scraper import SeleniumThreadsScraper
+
+
+def _scraper():
+    """建立不連接 WebDriver 的爬蟲，只用來呼叫解析方法"""
+    scraper = SeleniumThreadsScraper.__new__(SeleniumThreadsScraper)
+    scraper.driver = None
+    scraper.logger = logging.getLogger("test_comment_parsing")
+    return scraper
+
+
+def test_clean_keeps_words_inside_comment():
+    """句子中的 like、more、分享等字是留言內容，不能被刪除"""
+    clean = _scraper()._clean_comment_content
+    assert clean("I would like to win more prizes! 5 likes Reply") == "I would like to win more prizes!"
+    assert clean("I want to share this, follow me for more") == "I want to share this, follow me for more"
+    assert clean("我想要分享更多 3個讚 回覆") == "我想要分享更多"
+
+
+def test_clean_removes_label_lines():
+    """只有介面標籤的整行（Reply、5 likes）會被移除"""
+    clean = _scraper()._clean_comment_content
+    assert clean("抽我 @friend\nReply\n5 likes") == "抽我 @friend"
+    assert clean("Follow\nGood luck everyone") == "Good luck everyone"
+
+
+def _ago(parsed):
+    """回傳解析出的時間距今多久（無法解析時為 None）"""
+    return None if parsed is None else datetime.now() - parsed
+
+
+def test_relative_time_units():
+    """相對時間（2h、3 days、3天前、2mo）會換算成正確的時間差"""
+    parse = _scraper()._parse_relative_time
+    assert abs(_ago(parse("2h")) - timedelta(hours=2)) < timedelta(minutes=1)
+    assert abs(_ago(parse("3 days ago")) - timedelta(days=3)) < timedelta(minutes=1)
+    assert abs(_ago(parse("3天前")) - timedelta(days=3)) < timedelta(minutes=1)
+    assert abs(_ago(parse("2mo")) - timedelta(days=60)) < timedelta(minutes=1)
+
+
+def test_relative_time_ignores_ordinary_words():
+    """一般文字中的「數字 + 單字」（2 dogs、3 more）不是時間"""
+    parse = _scraper()._parse_relative_time
+    assert parse("I have 2 dogs") is None
+    assert parse("3 more") is None
+    assert _scraper()._extract_time_from_text("抽我\nI have 2 dogs") is None
+
+
+def main():
+    """執行所有測試"""
+    tests = [
+        test_clean_keeps_words_inside_comment,
+        test_clean_removes_label_lines,
+        test_relative_time_units,
+        test_relative_time_ignores_ordinary_words,
+    ]
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__doc__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__doc__}: {e}")
+
+    print(f"\n📊 測試結果: {len(tests) - failed}/{len(tests)} 通過")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
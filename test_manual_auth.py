@@ -3,45 +3,172 @@
 測試 Threads 手動認證功能
 此腳本展示如何使用互動式登入來認證 Threads 帳戶
 """
+import argparse
+import atexit
 import sys
 import os
-sys.path.append(os.getcwd())
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+
+# 以腳本所在的專案根目錄匯入 src，不受執行時所在目錄影響
+ROOT = os.path.dirname(os.path.abspath(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
 
 from src.main.python.config.auth_config import AuthConfig, AuthMode
-from src.main.python.services.scrapers.selenium_threads_scraper import SeleniumThreadsScraper
+
+# Selenium 相關模組載入需要數百毫秒，只在真正啟動瀏覽器時才匯入，
+# 讓選項 3、4 不必負擔這段時間
+if TYPE_CHECKING:
+    from src.main.python.auth.cookie_storage import CookieStorage
+    from src.main.python.services.scrapers.selenium_threads_scraper import SeleniumThreadsScraper
+
+
+# 持久化的 Chrome 設定檔目錄：登入後由 Chrome 自行保存 cookies，
+# 之後啟動時不必重新登入，可以直接使用無頭模式
+CHROME_PROFILE_DIR = os.path.expanduser("~/.cache/lottery-web/chrome-profile")
+
+# 設定後改用常駐的 Selenium 服務（例如 selenium/standalone-chrome 容器），
+# 不必每次執行都啟動 chromedriver 與 Chrome
+SELENIUM_REMOTE_URL = os.environ.get("SELENIUM_REMOTE_URL")
+
+# 互動式選單，每次迴圈一次寫出
+_MENU = (
+    "\\n請選擇測試項目:\n"
+    "1. 手動認證測試（需要在瀏覽器中登入）\n"
+    "2. Cookie 持久化測試\n"
+    "3. 顯示配置選項\n"
+    "4. 退出\n"
+)
+
+# 失敗時是否顯示 traceback（LOTTERY_DEBUG=1 或 --verbose）
+DEBUG = bool(os.environ.get("LOTTERY_DEBUG"))
+
+# 認證模式清單是固定的，只有「(目前)」標記會隨設定改變
+_MODE_LINES = [(mode, f"  • {mode.value}: {mode.name}") for mode in AuthMode]
+
+
+@lru_cache(maxsize=1)
+def _config() -> AuthConfig:
+    """整個測試工作階段共用的認證設定，只讀取一次環境變數"""
+    return AuthConfig()
+
+
+@lru_cache(maxsize=1)
+def _cookie_storage() -> 'CookieStorage':
+    """整個測試工作階段共用的 cookie 儲存（加密金鑰只推導一次），設定與 AuthManager 相同"""
+    from src.main.python.auth.cookie_storage import CookieStorage
+    config = _config()
+    return CookieStorage(
+        config.cookie_file_path,
+        encryption_key=config.cookie_encryption_key,
+        max_age_hours=config.session_timeout_hours
+    )
+
+
+def _has_saved_login() -> bool:
+    """檢查是否已有可用的登入狀態（Chrome 設定檔存在且儲存的 cookies 未過期）"""
+    if not os.path.exists(CHROME_PROFILE_DIR):
+        return False
+    
+    cookie_info = _cookie_storage().get_cookie_info()
+    return bool(cookie_info) and not cookie_info['expired']
+
+
+# 背景關閉中的瀏覽器；它結束前仍鎖著 CHROME_PROFILE_DIR
+_cleanup_thread: Optional[threading.Thread] = None
+
+
+def _create_scraper(headless: bool, timeout: int) -> 'SeleniumThreadsScraper':
+    """建立使用持久化設定檔的 Selenium 爬蟲（不輸出訊息，可在背景執行緒呼叫）"""
+    from src.main.python.services.scrapers.selenium_threads_scraper import SeleniumThreadsScraper
+    
+    # 先等上一個瀏覽器完全關閉，否則新的 Chrome 會因設定檔被鎖住而無法啟動
+    if _cleanup_thread is not None:
+        _cleanup_thread.join()
+    
+    if SELENIUM_REMOTE_URL:
+        # 本機的設定檔路徑在遠端瀏覽器上沒有意義，由遠端服務自行管理
+        return SeleniumThreadsScraper(
+            headless=headless,
+            timeout=timeout,
+            remote_url=SELENIUM_REMOTE_URL
+        )
+    
+    return SeleniumThreadsScraper(
+        headless=headless,
+        timeout=timeout,
+        user_data_dir=CHROME_PROFILE_DIR
+    )
+
+
+def _launch_scraper(headless: bool, timeout: int) -> 'SeleniumThreadsScraper':
+    """啟動使用持久化設定檔的 Selenium 瀏覽器"""
+    print("🚀 啟動 Selenium 瀏覽器...")
+    scraper = _create_scraper(headless, timeout)
+    print("✅ 瀏覽器啟動成功")
+    return scraper
+
+
+def _cleanup_in_background(scraper: 'SeleniumThreadsScraper'):
+    """
+    在背景執行緒關閉瀏覽器，不必等待 Chrome 與 chromedriver 結束
+    
+    下一次啟動瀏覽器前會等它關閉完成；程式結束前最多等待 5 秒，
+    避免留下 Chrome 程序
+    """
+    global _cleanup_thread
+    _cleanup_thread = threading.Thread(target=scraper.cleanup, daemon=True)
+    _cleanup_thread.start()
+    atexit.register(_cleanup_thread.join, timeout=5)
+
+
+def _prewarm_scraper() -> 'SeleniumThreadsScraper':
+    """在背景啟動共用的瀏覽器；已有登入狀態時使用無頭模式"""
+    return _create_scraper(headless=_has_saved_login(), timeout=30)
 
 
-def test_manual_authentication():
-    """測試手動認證功能"""
+def test_manual_authentication(get_scraper=None, test_url=None):
+    """
+    測試手動認證功能
     
-    print("🔐 Threads 手動認證測試")
-    print("=" * 50)
+    Args:
+        get_scraper: 取得共用爬蟲的函數；未提供時自行啟動瀏覽器並在結束時關閉
+        test_url: 要測試的貼文網址；未提供時詢問使用者
+    """
+    
+    sys.stdout.write("🔐 Threads 手動認證測試\n" + "=" * 50 + "\n")
     
     # 設置手動認證模式
-    config = AuthConfig()
+    config = _config()
     config.update_mode(AuthMode.MANUAL)
     
-    print(f"📋 認證模式: {config.auth_mode.value}")
-    print(f"📁 Cookie 儲存位置: {config.cookie_file_path}")
-    print()
+    sys.stdout.write(
+        f"📋 認證模式: {config.auth_mode.value}\n"
+        f"📁 Cookie 儲存位置: {config.cookie_file_path}\n\n"
+    )
     
     # 測試網址（使用者可以替換成自己想測試的網址）
-    test_url = input("請輸入要測試的 Threads 貼文網址（或按 Enter 使用預設）: ").strip()
+    if test_url is None:
+        test_url = input("請輸入要測試的 Threads 貼文網址（或按 Enter 使用預設）: ").strip()
     if not test_url:
         test_url = "https://www.threads.com/@threads/post/C-hGtjvOl_k"  # Threads 官方帳號的貼文
     
-    print(f"🌐 測試網址: {test_url}")
-    print()
+    sys.stdout.write(f"🌐 測試網址: {test_url}\n\n")
     
     try:
-        # 創建爬蟲（非無頭模式以便手動登入）
-        print("🚀 啟動 Selenium 瀏覽器...")
-        scraper = SeleniumThreadsScraper(
-            headless=False,  # 顯示瀏覽器視窗以便手動登入
-            timeout=30
-        )
-        
-        print("✅ 瀏覽器啟動成功")
+        # 創建爬蟲，或沿用共用的瀏覽器。只有在還沒有登入狀態時才需要
+        # 顯示瀏覽器視窗以便手動登入
+        if get_scraper is None:
+            headless = _has_saved_login()
+            if headless:
+                print("🔓 已有登入狀態，以無頭模式啟動")
+            scraper = _launch_scraper(headless=headless, timeout=30)
+        else:
+            scraper = get_scraper()
         print()
         
         # 嘗試爬取留言（會觸發認證流程）
@@ -53,46 +180,72 @@ def test_manual_authentication():
         # 顯示前幾條留言作為示例
         if comments:
             print("\\n📋 留言預覽:")
-            for i, comment in enumerate(comments[:5], 1):
-                print(f"  {i}. @{comment.username}: {comment.content[:100]}...")
+            # 留言已由爬蟲以單次 execute_script 取回並轉成 Comment 物件，
+            # 預覽直接讀取這些物件，不會再和瀏覽器往返；改在頁面上重新查詢
+            # 反而多一次往返，選到的元素也可能和實際爬到的留言不同。
+            # 一次寫出整段預覽，而不是每條留言各呼叫一次 print；
+            # join 傳入 list，省去 join 內部先把產生器轉成序列的步驟
+            sys.stdout.write("\n".join([
+                f"  {i}. @{comment.username}: {comment.content[:100]}..."
+                for i, comment in enumerate(comments[:5], 1)
+            ]) + "\n")
         
         # 檢查認證狀態
         auth_status = scraper.auth_manager.get_auth_status()
         print(f"\\n🔐 認證狀態: {auth_status}")
         
-        # 清理
-        scraper.cleanup()
-        print("\\n✅ 測試完成，瀏覽器已關閉")
+        # 清理（共用的瀏覽器留給下一次測試，由主選單在離開時關閉）
+        if get_scraper is None:
+            _cleanup_in_background(scraper)
+            print("\\n✅ 測試完成，瀏覽器關閉中")
+        else:
+            print("\\n✅ 測試完成")
         
         return True
         
     except Exception as e:
         print(f"❌ 測試失敗: {e}")
-        import traceback
-        traceback.print_exc()
+        if DEBUG:
+            import traceback
+            traceback.print_exception(type(e), e, e.__traceback__, limit=-5)
+        else:
+            print("   （設定 LOTTERY_DEBUG=1 或使用 --verbose 顯示 traceback）")
         return False
 
 
-def test_cookie_persistence():
-    """測試 Cookie 持久化功能"""
+def test_cookie_persistence(get_scraper=None):
+    """
+    測試 Cookie 持久化功能
     
-    print("\\n🍪 Cookie 持久化測試")
-    print("=" * 30)
+    Args:
+        get_scraper: 取得共用爬蟲的函數；未提供時自行啟動瀏覽器並在結束時關閉
+    """
     
-    # 檢查是否有已儲存的 cookies
-    config = AuthConfig()
+    sys.stdout.write("\\n🍪 Cookie 持久化測試\n" + "=" * 30 + "\n")
     
-    from src.main.python.auth.cookie_storage import CookieStorage
-    cookie_storage = CookieStorage(config.cookie_file_path)
+    # 檢查是否有已儲存的 cookies。檔案是在記錄儲存時間之後才寫入，
+    # 所以修改時間已超過有效期限（THREADS_SESSION_TIMEOUT，與 CookieStorage
+    # 使用同一個設定）時必定過期，不必解密檔案就能判斷
+    config = _config()
+    try:
+        cookie_age = time.time() - os.path.getmtime(os.path.expanduser(config.cookie_file_path))
+    except FileNotFoundError:
+        print("ℹ️  沒有找到儲存的 cookies")
+        return
+    if cookie_age > config.session_timeout_hours * 60 * 60:
+        print("⚠️  儲存的 cookies 已過期")
+        return
     
-    cookie_info = cookie_storage.get_cookie_info()
+    cookie_info = _cookie_storage().get_cookie_info()
     
     if cookie_info:
-        print("✅ 發現已儲存的 cookies:")
-        print(f"   網域: {cookie_info['domain']}")
-        print(f"   儲存時間: {cookie_info['saved_at']}")
-        print(f"   Cookie 數量: {cookie_info['cookie_count']}")
-        print(f"   是否過期: {cookie_info['expired']}")
+        sys.stdout.write(
+            "✅ 發現已儲存的 cookies:\n"
+            f"   網域: {cookie_info['domain']}\n"
+            f"   儲存時間: {cookie_info['saved_at']}\n"
+            f"   Cookie 數量: {cookie_info['cookie_count']}\n"
+            f"   是否過期: {cookie_info['expired']}\n"
+        )
         
         if not cookie_info['expired']:
             print("\\n🔄 測試自動認證...")
@@ -103,11 +256,15 @@ def test_cookie_persistence():
             test_url = "https://www.threads.com/@threads/post/C-hGtjvOl_k"
             
             try:
-                scraper = SeleniumThreadsScraper(headless=True, timeout=20)
+                if get_scraper is None:
+                    scraper = _launch_scraper(headless=True, timeout=20)
+                else:
+                    scraper = get_scraper()
                 comments = scraper.scrape_comments(test_url)
                 
                 print(f"✅ 自動認證成功！爬取了 {len(comments)} 條留言")
-                scraper.cleanup()
+                if get_scraper is None:
+                    _cleanup_in_background(scraper)
                 
             except Exception as e:
                 print(f"❌ 自動認證失敗: {e}")
@@ -120,39 +277,139 @@ def test_cookie_persistence():
 def show_config_options():
     """顯示配置選項"""
     
-    print("\\n⚙️  認證配置選項")
-    print("=" * 30)
+    sys.stdout.write("\\n⚙️  認證配置選項\n" + "=" * 30 + "\n")
     
-    config = AuthConfig()
+    config = _config()
     
     print("可用的認證模式:")
-    for mode in AuthMode:
-        current = " (目前)" if mode == config.auth_mode else ""
-        print(f"  • {mode.value}: {mode.name}{current}")
+    print("\n".join(
+        line + (" (目前)" if mode == config.auth_mode else "")
+        for mode, line in _MODE_LINES
+    ))
     
     print(f"\\n環境變數設定範例:")
     print(config.create_example_env())
 
 
+# 可由命令列 --run 指定的測試項目
+TEST_NAMES = ('manual', 'cookie', 'config')
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    """解析命令列參數；--run 的項目名稱會先驗證，拼錯時直接結束"""
+    parser = argparse.ArgumentParser(description="Threads 認證系統測試工具")
+    parser.add_argument(
+        '--run',
+        default='',
+        help=f"以逗號分隔要依序執行的測試（{', '.join(TEST_NAMES)}），"
+             "不經過互動式選單；未指定時顯示選單"
+    )
+    parser.add_argument('--url', help="手動認證測試使用的 Threads 貼文網址（不再詢問）")
+    parser.add_argument('--verbose', action='store_true', help="測試失敗時顯示 traceback")
+    
+    args = parser.parse_args(argv)
+    args.run = [name.strip() for name in args.run.split(',') if name.strip()]
+    unknown = [name for name in args.run if name not in TEST_NAMES]
+    if unknown:
+        parser.error(f"未知的測試項目: {', '.join(unknown)}（可用: {', '.join(TEST_NAMES)}）")
+    return args
+
+
+def _run_selected(names, get_scraper, test_url) -> bool:
+    """
+    依序執行命令列指定的測試，不需要任何鍵盤輸入
+    
+    Returns:
+        所有測試是否都成功
+    """
+    success = True
+    for name in names:
+        if name == "manual":
+            success = test_manual_authentication(get_scraper, test_url) and success
+        elif name == "cookie":
+            test_cookie_persistence(get_scraper)
+        elif name == "config":
+            show_config_options()
+    return success
+
+
 def main():
     """主函數"""
     
-    print("🎯 Threads 認證系統測試工具")
-    print("=" * 50)
+    global DEBUG
+    args = _parse_args()
+    DEBUG = DEBUG or args.verbose
+    
+    sys.stdout.write("🎯 Threads 認證系統測試工具\n" + "=" * 50 + "\n")
+    
+    # 所有測試共用同一個瀏覽器，離開選單時才關閉，省去每次測試重新啟動
+    # chromedriver 與 Chrome 的時間。手動認證測試一定會用到瀏覽器，選擇後
+    # 就於背景執行緒啟動，啟動時間（多半在等待子程序與 socket，不佔用 GIL）
+    # 與輸入網址的時間重疊。Cookie 測試只有在 cookies 未過期時才需要瀏覽器，
+    # 由 get_scraper 在那時才啟動；只看配置選項或直接退出時不會啟動
+    executor = ThreadPoolExecutor(max_workers=1)
+    pending = None
+    scraper = None
+    
+    def start_browser():
+        """在背景啟動共用的瀏覽器（已啟動或啟動中則不做任何事）"""
+        nonlocal pending
+        if scraper is None and pending is None:
+            pending = executor.submit(_prewarm_scraper)
+    
+    def get_scraper() -> 'SeleniumThreadsScraper':
+        nonlocal scraper, pending
+        if scraper is None:
+            # 尚未啟動，或上一次啟動失敗時重新嘗試
+            start_browser()
+            print("🚀 等待 Selenium 瀏覽器啟動...")
+            try:
+                scraper = pending.result()
+            finally:
+                pending = None
+            print("✅ 瀏覽器啟動成功")
+        else:
+            # 清除上一次測試留下的 cookies，讓每次測試都從乾淨的工作階段開始
+            scraper.driver.delete_all_cookies()
+        return scraper
+    
+    success = True
+    try:
+        if args.run:
+            if "manual" in args.run:
+                start_browser()
+            success = _run_selected(args.run, get_scraper, args.url)
+        else:
+            _menu_loop(get_scraper, start_browser, args.url)
+    finally:
+        # 背景啟動中的瀏覽器也要等它完成後關閉，避免留下 Chrome 程序
+        if pending is not None:
+            try:
+                scraper = pending.result()
+            except Exception:
+                pass
+        if scraper is not None:
+            scraper.cleanup()
+        executor.shutdown()
+    
+    # 非互動執行時以結束碼回報結果，方便 CI 判斷
+    if not success:
+        sys.exit(1)
+
+
+def _menu_loop(get_scraper, start_browser, test_url=None):
+    """互動式選單，直到使用者選擇退出"""
     
     while True:
-        print("\\n請選擇測試項目:")
-        print("1. 手動認證測試（需要在瀏覽器中登入）")
-        print("2. Cookie 持久化測試")
-        print("3. 顯示配置選項")
-        print("4. 退出")
+        sys.stdout.write(_MENU)
         
         choice = input("\\n請輸入選擇 (1-4): ").strip()
         
         if choice == "1":
-            test_manual_authentication()
+            start_browser()
+            test_manual_authentication(get_scraper, test_url)
         elif choice == "2":
-            test_cookie_persistence()
+            test_cookie_persistence(get_scraper)
         elif choice == "3":
             show_config_options()
         elif choice == "4":